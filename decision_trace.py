@@ -4,33 +4,55 @@ Decision Trace - Explain why a specific action was selected.
 Reads from log/decisions.json or history.json to trace decision paths.
 """
 
+import heapq
 import json
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
 from config import get_file_path, get_data_dir
 
+def _read_bytes(path):
+    """Read a whole file with one open/fstat/read; None if it does not exist."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except FileNotFoundError:
+        return None
+    try:
+        remaining = os.fstat(fd).st_size
+        chunks = []
+        while remaining > 0:
+            chunk = os.read(fd, remaining)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+def _load_json_list(path):
+    """Load a JSON array from path; missing, empty or blank files yield []."""
+    try:
+        data = _read_bytes(path)
+        if not data or data.isspace():
+            return []
+        return json.loads(data)
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError) as e:
+        print(f"Warning: Could not load {path.name}: {e}", file=sys.stderr)
+        return []
+
 def load_decisions_log():
     """Load decision log entries."""
+    # intrusive.sh trims decisions.json to the last 100 decisions, so loading
+    # the whole array is cheap; no columnar/indexed store is needed.
     decisions_file = get_data_dir() / "log" / "decisions.json"
-    
-    if decisions_file.exists():
-        try:
-            return json.loads(decisions_file.read_text())
-        except:
-            return []
-    return []
+    return _load_json_list(decisions_file)
 
 def load_history():
     """Load general history as fallback."""
     history_file = get_file_path("history.json")
-    
-    if history_file.exists():
-        try:
-            return json.loads(history_file.read_text())
-        except:
-            return []
-    return []
+    return _load_json_list(history_file)
 
 def find_decision_by_id(decisions, action_id):
     """Find a specific decision by action ID."""
@@ -41,15 +63,16 @@ def find_decision_by_id(decisions, action_id):
 
 def find_recent_decision(decisions):
     """Find the most recent decision."""
-    if not decisions:
-        return None
-    
-    # Sort by timestamp, most recent first
-    sorted_decisions = sorted(decisions, key=lambda d: d.get("timestamp", ""), reverse=True)
-    return sorted_decisions[0] if sorted_decisions else None
+    # Entries are appended in time order, but hand-edited or merged logs may
+    # not be, so take the latest timestamp in one linear pass instead of sorting
+    return max(decisions, key=lambda d: d.get("timestamp", ""), default=None)
+
+def explain_decision(decision, top=None, summary_only=False):
+    """Generate human-readable explanation of a decision.
 
-def explain_decision(decision):
-    """Generate human-readable explanation of a decision."""
+    If top is given, only the top N candidates by final weight are listed.
+    With summary_only, the per-candidate sections are skipped entirely.
+    """
     
     print("🧠 Decision Trace Analysis")
     print("=" * 50)
@@ -88,21 +111,27 @@ def explain_decision(decision):
     print(f"   Random roll value: {random_roll:.6f}")
     
     # All candidates analysis
-    all_candidates = decision.get("all_candidates", [])
+    all_candidates = [] if summary_only else decision.get("all_candidates", [])
     if all_candidates:
         print(f"\n⚖️ All Candidate Thoughts (ranked by final weight):")
         
-        # Sort candidates by final weight
-        sorted_candidates = sorted(all_candidates, key=lambda c: c.get("final_weight", 0), reverse=True)
+        # Rank candidates by final weight (partial selection when only the top N are shown)
+        weight_key = lambda c: c.get("final_weight", 0)
+        if top is not None and top < len(all_candidates):
+            sorted_candidates = heapq.nlargest(top, all_candidates, key=weight_key)
+        else:
+            sorted_candidates = sorted(all_candidates, key=weight_key, reverse=True)
         
+        winner_id = winner.get("id")
         for i, candidate in enumerate(sorted_candidates, 1):
-            thought_id = candidate.get("id", "unknown")
-            base_weight = candidate.get("original_weight", 0)
-            final_weight = candidate.get("final_weight", 0)
-            skip_reasons = candidate.get("skip_reasons", [])
-            boost_reasons = candidate.get("boost_reasons", [])
-            
-            status_icon = "🏆" if thought_id == winner.get("id") else f"{i:2d}."
+            g = candidate.get
+            thought_id = g("id", "unknown")
+            base_weight = g("original_weight", 0)
+            final_weight = g("final_weight", 0)
+            skip_reasons = g("skip_reasons") or ()
+            boost_reasons = g("boost_reasons") or ()
+
+            status_icon = "🏆" if thought_id == winner_id else f"{i:2d}."
             weight_change = final_weight - base_weight
             weight_indicator = f"({weight_change:+.1f})" if weight_change != 0 else ""
             
@@ -115,9 +144,13 @@ def explain_decision(decision):
             if skip_reasons:
                 for reason in skip_reasons:
                     print(f"       ❌ {reason}")
+        
+        hidden = len(all_candidates) - len(sorted_candidates)
+        if hidden > 0:
+            print(f"   ... {hidden} more candidates (use --top N to show more)")
     
     # Skipped thoughts (heavily dampened)
-    skipped_thoughts = decision.get("skipped_thoughts", [])
+    skipped_thoughts = [] if summary_only else decision.get("skipped_thoughts", [])
     if skipped_thoughts:
         print(f"\n🚫 Heavily Dampened Thoughts:")
         for skipped in skipped_thoughts:
@@ -182,7 +215,22 @@ def find_decision_from_history(history, action_id):
 
 def main():
     """Main CLI handler."""
-    action_id = sys.argv[1] if len(sys.argv) > 1 else None
+    args = sys.argv[1:]
+    as_json = "--json" in args
+    # JSON output is for machine consumers, so it implies quiet (no banners)
+    quiet = as_json or "--quiet" in args or bool(os.environ.get("DECISION_TRACE_QUIET"))
+    summary_only = "--summary" in args
+    args = [a for a in args if a not in ("--quiet", "--summary", "--json")]
+    top = None
+    if "--top" in args:
+        i = args.index("--top")
+        if i + 1 < len(args) and args[i + 1].isdigit():
+            top = int(args[i + 1])
+            del args[i:i + 2]
+        else:
+            print("Usage: decision_trace.py [action_id] [--top N] [--summary] [--quiet] [--json]")
+            sys.exit(1)
+    action_id = args[0] if args else None
     
     # Try to load from decisions log first
     decisions = load_decisions_log()
@@ -191,6 +239,8 @@ def main():
     if decisions:
         if action_id:
             decision = find_decision_by_id(decisions, action_id)
+            if not decision and quiet:
+                sys.exit(1)
             if not decision:
                 print(f"❌ No decision found for action ID: {action_id}")
                 print("Recent available action IDs:")
@@ -204,10 +254,21 @@ def main():
     
     # Fallback to history.json
     if not decision:
-        print("📝 No detailed decision log found, checking history.json...")
+        if not quiet:
+            print("📝 No detailed decision log found, checking history.json...")
         history = load_history()
         decision = find_decision_from_history(history, action_id)
     
+    # Scripted probes only need the winner id (or raw record) and exit status
+    if quiet:
+        if not decision:
+            sys.exit(1)
+        if as_json:
+            print(json.dumps(decision, indent=2))
+        else:
+            print(decision.get("winner", {}).get("id", "unknown"))
+        return
+    
     if not decision:
         print("❌ No decision information found.")
         print("Make sure the agent has made at least one decision, or specify a valid action ID.")
@@ -217,7 +278,7 @@ def main():
         print(f"⚠️ Note: {decision['note']}")
         print()
     
-    explain_decision(decision)
+    explain_decision(decision, top=top, summary_only=summary_only)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -4,6 +4,9 @@ Mood drift calculation logic extracted from log_result.sh for testing.
 This module provides pure functions for calculating mood drift from activity logs.
 """
 
+from types import MappingProxyType
+
+
 def calculate_energy_vibe_scores(activity_log):
     """
     Calculate energy and vibe scores from activity log.
@@ -36,31 +39,42 @@ def calculate_energy_vibe_scores(activity_log):
     return energy_score, vibe_score
 
 
+# How energy/vibe combinations affect mood traits. Built once at import;
+# exposed read-only since it is shared by every apply_activity_drift call.
+_DRIFT_MAP = MappingProxyType({
+    'high_positive': {
+        'boost': ['hyperfocus', 'chaotic', 'social'], 
+        'dampen': ['cozy', 'philosophical']
+    },
+    'high_negative': {
+        'boost': ['restless', 'determined'], 
+        'dampen': ['cozy', 'social']
+    },
+    'low_positive': {
+        'boost': ['cozy', 'philosophical', 'social'], 
+        'dampen': ['hyperfocus', 'chaotic']
+    },
+    'low_negative': {
+        'boost': ['cozy', 'philosophical'], 
+        'dampen': ['chaotic', 'social', 'restless']
+    },
+})
+
+# Same table as (boost, dampen) frozensets, so drift is applied with set ops
+_DRIFT_SETS = {
+    key: (frozenset(drift['boost']), frozenset(drift['dampen']))
+    for key, drift in _DRIFT_MAP.items()
+}
+
+
 def get_drift_map():
     """
     Get the drift map that defines how energy/vibe combinations affect mood traits.
     
     Returns:
-        dict: Drift map with energy_vibe keys mapping to boost/dampen lists
+        Mapping: Read-only drift map with energy_vibe keys mapping to boost/dampen lists
     """
-    return {
-        'high_positive': {
-            'boost': ['hyperfocus', 'chaotic', 'social'], 
-            'dampen': ['cozy', 'philosophical']
-        },
-        'high_negative': {
-            'boost': ['restless', 'determined'], 
-            'dampen': ['cozy', 'social']
-        },
-        'low_positive': {
-            'boost': ['cozy', 'philosophical', 'social'], 
-            'dampen': ['hyperfocus', 'chaotic']
-        },
-        'low_negative': {
-            'boost': ['cozy', 'philosophical'], 
-            'dampen': ['chaotic', 'social', 'restless']
-        },
-    }
+    return _DRIFT_MAP
 
 
 def apply_activity_drift(existing_boost, existing_dampen, energy, vibe):
@@ -76,27 +90,21 @@ def apply_activity_drift(existing_boost, existing_dampen, energy, vibe):
     Returns:
         tuple: (new_boost_set, new_dampen_set)
     """
-    drift_map = get_drift_map()
-    
     # Copy existing sets
     new_boost = set(existing_boost)
     new_dampen = set(existing_dampen)
     
     # Apply drift if not neutral
-    if energy != 'neutral' or vibe != 'neutral':
-        key = f"{energy}_{vibe}" if energy != 'neutral' and vibe != 'neutral' else None
-        if key and key in drift_map:
-            drift = drift_map[key]
+    if energy != 'neutral' and vibe != 'neutral':
+        drift = _DRIFT_SETS.get(f"{energy}_{vibe}")
+        if drift:
+            boost, dampen = drift
             
-            # Add new boosts and dampens
-            new_boost.update(drift['boost'])
-            new_dampen.update(drift['dampen'])
-            
-            # Remove contradictions (most recent wins)
-            for b in drift['boost']:
-                new_dampen.discard(b)
-            for d in drift['dampen']:
-                new_boost.discard(d)
+            # Add new boosts and dampens, removing contradictions (most recent wins)
+            new_boost |= boost
+            new_boost -= dampen
+            new_dampen |= dampen
+            new_dampen -= boost
     
     return new_boost, new_dampen
 
@@ -118,20 +126,30 @@ def calculate_mood_drift(activity_log, initial_boost=None, initial_dampen=None):
     if initial_dampen is None:
         initial_dampen = set()
     
-    energy_score, vibe_score = calculate_energy_vibe_scores(activity_log)
+    # Single pass: accumulate scores (as calculate_energy_vibe_scores does)
+    # while remembering the most recent activity's energy/vibe for drift
+    energy_score = 0
+    vibe_score = 0
+    energy = vibe = 'neutral'
     
-    # Apply drift from the most recent activity  
-    if activity_log:
-        latest = activity_log[-1]
-        energy = latest.get('energy', 'neutral')
-        vibe = latest.get('vibe', 'neutral')
+    for activity in activity_log:
+        energy = activity.get('energy', 'neutral')
+        vibe = activity.get('vibe', 'neutral')
+        
+        if energy == 'high':
+            energy_score += 1
+        elif energy == 'low':
+            energy_score -= 1
         
-        boosted_traits, dampened_traits = apply_activity_drift(
-            initial_boost, initial_dampen, energy, vibe
-        )
-    else:
-        boosted_traits = set(initial_boost)
-        dampened_traits = set(initial_dampen)
+        if vibe == 'positive':
+            vibe_score += 1
+        elif vibe == 'negative':
+            vibe_score -= 1
+    
+    # Apply drift from the most recent activity (a no-op for an empty log)
+    boosted_traits, dampened_traits = apply_activity_drift(
+        initial_boost, initial_dampen, energy, vibe
+    )
     
     return {
         'energy_score': energy_score,
@@ -141,6 +159,45 @@ def calculate_mood_drift(activity_log, initial_boost=None, initial_dampen=None):
     }
 
 
+_HYPERFOCUS_DRIFT = {
+    'drifted_to': 'hyperfocus',
+    'drift_note': 'Riding high — everything is clicking today'
+}
+_COZY_DRIFT = {
+    'drifted_to': 'cozy', 
+    'drift_note': 'Low energy day — pulling back to recharge'
+}
+_RESTLESS_DRIFT = {
+    'drifted_to': 'restless',
+    'drift_note': 'High energy but frustrated — need to channel this'
+}
+_SOCIAL_DRIFT = {
+    'drifted_to': 'social',
+    'drift_note': 'Good vibes — feeling chatty'
+}
+
+# Mood drift indexed by energy_bucket * 4 + vibe_bucket. Energy buckets are
+# (<= -2, between, >= 2); vibe buckets are (<= -2, -1, 0..1, >= 2). Entries
+# follow the original precedence: hyperfocus, cozy, restless, then social.
+_MOOD_DRIFT_LUT = (
+    _COZY_DRIFT, None, None, _SOCIAL_DRIFT,
+    None, None, None, _SOCIAL_DRIFT,
+    _RESTLESS_DRIFT, _RESTLESS_DRIFT, None, _HYPERFOCUS_DRIFT,
+)
+
+
+def _energy_bucket(score):
+    return 0 if score <= -2 else (2 if score >= 2 else 1)
+
+
+def _vibe_bucket(score):
+    if score <= -2:
+        return 0
+    if score <= -1:
+        return 1
+    return 3 if score >= 2 else 2
+
+
 def get_mood_name_from_scores(energy_score, vibe_score, activity_count=0):
     """
     Determine if mood name should change based on energy/vibe scores.
@@ -156,25 +213,5 @@ def get_mood_name_from_scores(energy_score, vibe_score, activity_count=0):
     if activity_count < 3:
         return None
     
-    if energy_score >= 2 and vibe_score >= 2:
-        return {
-            'drifted_to': 'hyperfocus',
-            'drift_note': 'Riding high — everything is clicking today'
-        }
-    elif energy_score <= -2 and vibe_score <= -2:
-        return {
-            'drifted_to': 'cozy', 
-            'drift_note': 'Low energy day — pulling back to recharge'
-        }
-    elif energy_score >= 2 and vibe_score <= -1:
-        return {
-            'drifted_to': 'restless',
-            'drift_note': 'High energy but frustrated — need to channel this'
-        }
-    elif vibe_score >= 2:
-        return {
-            'drifted_to': 'social',
-            'drift_note': 'Good vibes — feeling chatty'
-        }
-    
-    return None
\ No newline at end of file
+    drift = _MOOD_DRIFT_LUT[_energy_bucket(energy_score) * 4 + _vibe_bucket(vibe_score)]
+    return dict(drift) if drift else None
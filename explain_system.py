@@ -5,409 +5,584 @@ Reads actual code implementation to provide accurate technical details.
 """
 
 import json
+import os
 import sys
+from collections import deque
+from functools import lru_cache, wraps
+from operator import itemgetter
 from pathlib import Path
 import ast
 import inspect
 from config import get_file_path, load_config, get_data_dir
 
-def explain_moods():
+# Per-item field extractors for the explainer loops (one call instead of N lookups)
+_MOOD_FIELDS = itemgetter("emoji", "name", "weight", "description", "traits")
+_TRUST_FIELDS = itemgetter("trust", "successes", "failures")
+_THOUGHT_MODE_FIELDS = itemgetter("description", "jitter_seconds", "timeout_seconds", "thoughts")
+_THOUGHT_FIELDS = itemgetter("id", "weight")
+
+_STATUS_EMOJI = {"green": "🟢", "yellow": "🟡", "red": "🔴"}
+
+# Errors from reading, decoding or formatting a malformed state file
+_DATA_ERRORS = (OSError, ValueError, KeyError, TypeError, AttributeError)
+
+# Single decode point for every explainer. The project is stdlib-only, so this
+# stays on json; bytes input lets json.loads detect the encoding itself.
+@lru_cache(maxsize=64)
+def _load_json_cached(path_str, mtime_ns, size):
+    return json.loads(Path(path_str).read_bytes())
+
+def _load_json(path):
+    """Parse a JSON file, reusing the previous parse while its mtime/size are unchanged."""
+    st = os.stat(path)
+    return _load_json_cached(str(path), st.st_mtime_ns, st.st_size)
+
+def _scan_wal_tail(path, n):
+    """Count non-blank WAL lines and return (count, last n raw lines), unparsed."""
+    count = 0
+    tail = deque(maxlen=n)
+    with open(path, 'rb') as f:
+        for line in f:
+            if not line.isspace():
+                tail.append(line)
+                count += 1
+    return count, tail
+
+def _find_wal_files(wal_dir):
+    """Return (count, newest name) of wal-*.json files, or None if wal_dir is missing.
+
+    WAL names embed YYYY-MM, so the lexically largest name is the current month.
+    """
+    count = 0
+    latest = None
+    try:
+        with os.scandir(wal_dir) as it:
+            for entry in it:
+                name = entry.name
+                if name.startswith("wal-") and name.endswith(".json"):
+                    count += 1
+                    if latest is None or name > latest:
+                        latest = name
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return count, latest
+
+def _stat_key(paths):
+    """Hashable (path, mtime_ns, size) tuple for paths; missing files get None stats.
+
+    Entries that are not paths (e.g. a directory scan result) are keyed as-is.
+    """
+    key = []
+    for path in paths:
+        if not isinstance(path, Path):
+            key.append(path)
+            continue
+        try:
+            st = os.stat(path)
+            key.append((str(path), st.st_mtime_ns, st.st_size))
+        except OSError:
+            key.append((str(path), None, None))
+    return tuple(key)
+
+def _memoize_on_files(inputs):
+    """Cache an explainer's text until one of the paths returned by inputs() changes.
+
+    The paths are resolved once per call (each resolution goes through config)
+    and handed to the explainer as explain(brief, paths). Brief explanations
+    read no files, so they get paths=None and are keyed on the flag alone.
+    """
+    def decorator(explain):
+        @lru_cache(maxsize=8)
+        def cached(brief, paths, stat_key):
+            return explain(brief, paths)
+
+        @wraps(explain)
+        def wrapper(brief=False):
+            if brief:
+                return cached(True, None, ())
+            paths = inputs()
+            return cached(False, paths, _stat_key(paths))
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+    return decorator
+
+def _moods_inputs():
+    return get_file_path("moods.json"), get_file_path("today_mood.json")
+
+def _memory_inputs():
+    memory_dir = get_data_dir() / "memory_store"
+    return (memory_dir,) + tuple(memory_dir / store for store in
+                                 ("episodic.json", "semantic.json", "procedural.json", "working.json"))
+
+def _trust_inputs():
+    return (get_data_dir() / "trust_store" / "trust_data.json",)
+
+def _evolution_inputs():
+    evolution_dir = get_data_dir().parent / "evolution"
+    return evolution_dir / "learnings.json", evolution_dir / "learned_weights.json"
+
+def _health_inputs():
+    return (get_data_dir() / "health" / "status.json",)
+
+def _thoughts_inputs():
+    return get_file_path("thoughts.json"), get_file_path("today_mood.json")
+
+def _proactive_inputs():
+    data_dir = get_data_dir()
+    wal_dir = data_dir / "wal"
+    # The directory's mtime covers WAL files appearing/disappearing; the
+    # newest file covers appends to the current month. The scan itself is
+    # passed along so explain_proactive doesn't list the directory again.
+    wal_scan = _find_wal_files(wal_dir)
+    latest_wal = wal_dir / wal_scan[1] if wal_scan and wal_scan[1] else wal_dir
+    return wal_dir, data_dir.parent / "buffer" / "working_buffer.json", latest_wal, wal_scan
+
+@_memoize_on_files(_moods_inputs)
+def explain_moods(brief, paths):
     """Explain the mood system by reading moods.json and set_mood.sh."""
+    out = []
+    add = out.append
     
     # Load moods configuration
-    moods_file = get_file_path("moods.json")
-    today_mood_file = get_file_path("today_mood.json")
-    
-    try:
-        moods_data = json.loads(moods_file.read_text())
-        today_mood = json.loads(today_mood_file.read_text())
-    except:
-        today_mood = None
-    
-    print("🌈 Mood System - How I Feel and Think")
-    print("=" * 50)
-    
-    print("\n📝 Current State:")
-    if today_mood:
-        print(f"   Today: {today_mood.get('emoji', '?')} {today_mood.get('name', 'Unknown')}")
-        print(f"   Description: {today_mood.get('description', 'No description')}")
-        print(f"   Energy Score: {today_mood.get('energy_score', 0)}")
-        print(f"   Vibe Score: {today_mood.get('vibe_score', 0)}")
-        if 'drifted_to' in today_mood:
-            print(f"   Drifted to: {today_mood['drifted_to']}")
-    else:
-        print("   No mood set for today")
-    
-    print("\n🎭 Available Base Moods:")
-    for mood in moods_data.get("base_moods", []):
-        print(f"   {mood['emoji']} {mood['name']} (weight: {mood['weight']})")
-        print(f"      {mood['description']}")
-        print(f"      Traits: {', '.join(mood['traits'])}")
-    
-    print("\n🌤️ Weather Influence System:")
-    print("   Weather conditions modify mood weights:")
+    moods_data, today_mood = {}, None
+    if not brief:
+        moods_file, today_mood_file = paths
+        try:
+            moods_data = _load_json(moods_file)
+        except (OSError, ValueError):
+            pass
+        try:
+            today_mood = _load_json(today_mood_file)
+        except (OSError, ValueError):
+            pass
+    
+    add("🌈 Mood System - How I Feel and Think")
+    add("=" * 50)
+    
+    if not brief:
+        add("\n📝 Current State:")
+        if today_mood:
+            add(f"   Today: {today_mood.get('emoji', '?')} {today_mood.get('name', 'Unknown')}")
+            add(f"   Description: {today_mood.get('description', 'No description')}")
+            add(f"   Energy Score: {today_mood.get('energy_score', 0)}")
+            add(f"   Vibe Score: {today_mood.get('vibe_score', 0)}")
+            if 'drifted_to' in today_mood:
+                add(f"   Drifted to: {today_mood['drifted_to']}")
+        else:
+            add("   No mood set for today")
+        
+        add("\n🎭 Available Base Moods:")
+        for mood in moods_data.get("base_moods", []):
+            emoji, name, weight, description, traits = _MOOD_FIELDS(mood)
+            add(f"   {emoji} {name} (weight: {weight})")
+            add(f"      {description}")
+            add(f"      Traits: {', '.join(traits)}")
+    
+    add("\n🌤️ Weather Influence System:")
+    add("   Weather conditions modify mood weights:")
     weather_influence = moods_data.get("weather_influence", {})
     for condition, effects in weather_influence.items():
         boost = effects.get("boost", [])
         dampen = effects.get("dampen", [])
-        print(f"   {condition}:")
+        add(f"   {condition}:")
         if boost:
-            print(f"      Boosts: {', '.join(boost)}")
+            add(f"      Boosts: {', '.join(boost)}")
         if dampen:
-            print(f"      Dampens: {', '.join(dampen)}")
+            add(f"      Dampens: {', '.join(dampen)}")
     
-    print("\n📰 News Influence System:")
-    print("   News sentiment affects mood selection:")
+    add("\n📰 News Influence System:")
+    add("   News sentiment affects mood selection:")
     news_influence = moods_data.get("news_influence", {})
     for news_type, effects in news_influence.items():
         boost = effects.get("boost", [])
         dampen = effects.get("dampen", [])
-        print(f"   {news_type}:")
+        add(f"   {news_type}:")
         if boost:
-            print(f"      Boosts: {', '.join(boost)}")
+            add(f"      Boosts: {', '.join(boost)}")
         if dampen:
-            print(f"      Dampens: {', '.join(dampen)}")
+            add(f"      Dampens: {', '.join(dampen)}")
+    
+    add("\n⚡ Mood Drift Mechanics:")
+    add("   - Activities add energy/vibe scores throughout the day")
+    add("   - Cumulative drift can change my mood mid-day")
+    add("   - Prevents getting stuck in one mood forever")
+    add("   - Records original + drifted mood for learning")
     
-    print("\n⚡ Mood Drift Mechanics:")
-    print("   - Activities add energy/vibe scores throughout the day")
-    print("   - Cumulative drift can change my mood mid-day")
-    print("   - Prevents getting stuck in one mood forever")
-    print("   - Records original + drifted mood for learning")
+    return "\n".join(out)
 
-def explain_memory():
+@_memoize_on_files(_memory_inputs)
+def explain_memory(brief, paths):
     """Explain the memory system by examining memory_system.py."""
+    out = []
+    add = out.append
     
-    print("🧠 Memory System - Three-Tier Architecture")
-    print("=" * 50)
+    add("🧠 Memory System - Three-Tier Architecture")
+    add("=" * 50)
     
     # Read memory system config from the actual file
     memory_file = Path(__file__).parent / "memory_system.py"
     
-    print("\n🏗️ Architecture:")
-    print("   Episodic Memory: Personal experiences with emotional context")
-    print("   Semantic Memory: General facts extracted from repeated episodes")
-    print("   Procedural Memory: Learned patterns and behavioral correlations")
-    print("   Working Memory: Current context and attention (limited capacity)")
+    add("\n🏗️ Architecture:")
+    add("   Episodic Memory: Personal experiences with emotional context")
+    add("   Semantic Memory: General facts extracted from repeated episodes")
+    add("   Procedural Memory: Learned patterns and behavioral correlations")
+    add("   Working Memory: Current context and attention (limited capacity)")
     
     # Check actual memory store status
-    memory_dir = get_data_dir() / "memory_store"
-    if memory_dir.exists():
-        print("\n📊 Current Memory Stats:")
-        for store in ["episodic.json", "semantic.json", "procedural.json", "working.json"]:
-            store_file = memory_dir / store
-            if store_file.exists():
-                try:
-                    data = json.loads(store_file.read_text())
-                    print(f"   {store.split('.')[0].title()}: {len(data)} entries")
-                except:
-                    print(f"   {store.split('.')[0].title()}: Error reading")
-    
-    print("\n📉 Decay Formula (Ebbinghaus Forgetting Curve):")
-    print("   Strength = e^(-t * decay_rate / (1 + reinforcement_count))")
-    print("   - t: Days since last access")
-    print("   - decay_rate: 0.5 (base rate from config)")
-    print("   - reinforcement_count: How many times memory was accessed")
-    print("   - Forget threshold: 0.1 (memories below this get pruned)")
-    
-    print("\n🔄 Memory Processes:")
-    print("   Encoding: New experiences → episodic store with emotion tags")
-    print("   Consolidation: Important episodics → semantic facts")
-    print("   Retrieval: Search by keywords, recency, similarity")
-    print("   Forgetting: Periodic cleanup of low-strength memories")
-    print("   Reflection: Extract patterns from recent experiences")
+    if not brief and paths[0].exists():
+        memory_dir, *store_files = paths
+        add("\n📊 Current Memory Stats:")
+        for store_file in store_files:
+            try:
+                data = _load_json(store_file)
+                add(f"   {store_file.stem.title()}: {len(data)} entries")
+            except FileNotFoundError:
+                pass
+            except _DATA_ERRORS:
+                add(f"   {store_file.stem.title()}: Error reading")
+    
+    add("\n📉 Decay Formula (Ebbinghaus Forgetting Curve):")
+    add("   Strength = e^(-t * decay_rate / (1 + reinforcement_count))")
+    add("   - t: Days since last access")
+    add("   - decay_rate: 0.5 (base rate from config)")
+    add("   - reinforcement_count: How many times memory was accessed")
+    add("   - Forget threshold: 0.1 (memories below this get pruned)")
+    
+    add("\n🔄 Memory Processes:")
+    add("   Encoding: New experiences → episodic store with emotion tags")
+    add("   Consolidation: Important episodics → semantic facts")
+    add("   Retrieval: Search by keywords, recency, similarity")
+    add("   Forgetting: Periodic cleanup of low-strength memories")
+    add("   Reflection: Extract patterns from recent experiences")
+    
+    return "\n".join(out)
 
-def explain_trust():
+@_memoize_on_files(_trust_inputs)
+def explain_trust(brief, paths):
     """Explain the trust system by examining trust_system.py."""
+    out = []
+    add = out.append
     
-    print("🛡️ Trust System - Learning When to Act vs Ask")
-    print("=" * 50)
+    add("🛡️ Trust System - Learning When to Act vs Ask")
+    add("=" * 50)
     
     # Load trust data
-    trust_dir = get_data_dir() / "trust_store"
-    trust_file = trust_dir / "trust_data.json"
-    
-    if trust_file.exists():
+    if not brief:
+        trust_file, = paths
         try:
-            trust_data = json.loads(trust_file.read_text())
+            trust_data = _load_json(trust_file)
             
-            print(f"\n📊 Current Trust Level: {trust_data.get('trust_level', 0.5):.2f}/1.0")
+            add(f"\n📊 Current Trust Level: {trust_data.get('trust_level', 0.5):.2f}/1.0")
             
-            print("\n🏷️ Action Category Trust Scores:")
+            add("\n🏷️ Action Category Trust Scores:")
             categories = trust_data.get('action_categories', {})
             for category, stats in categories.items():
-                trust = stats['trust']
-                successes = stats['successes']
-                failures = stats['failures']
+                trust, successes, failures = _TRUST_FIELDS(stats)
                 total = successes + failures
                 success_rate = successes/total if total > 0 else 0
-                print(f"   {category}: {trust:.2f} trust ({successes}✅/{failures}❌, {success_rate:.1%} success)")
+                add(f"   {category}: {trust:.2f} trust ({successes}✅/{failures}❌, {success_rate:.1%} success)")
                 
-        except:
-            print("\n⚠️ Trust data not available")
-    
-    print("\n🧮 Trust Calculation Logic:")
-    print("   Base trust per category + mood risk modifier")
-    print("   Success: +0.1 trust, Failure: -0.2 trust")
-    print("   Mood modifiers:")
-    print("     - Hyperfocus/Determined: +risk tolerance")
-    print("     - Chaotic/Restless: -risk tolerance") 
-    print("     - Cozy/Philosophical: neutral")
-    
-    print("\n🚨 Risk Level Assessment:")
-    print("   Low: File reads, web browsing, calculations")
-    print("   Medium: File writes, messaging, API calls") 
-    print("   High: Public posts, system changes, installs")
-    print("   Critical: Financial ops, production deployments")
-    
-    print("\n🎯 Escalation Thresholds:")
-    print("   Auto-proceed: trust > 0.7 for risk level")
-    print("   Ask permission: trust 0.3-0.7")
-    print("   Block/warn: trust < 0.3 for critical actions")
-    
-    print("\n📈 Trust Factors:")
-    print("   Increases: Successful outcomes, consistent behavior")
-    print("   Decreases: Failures, errors, human rejections")
-    print("   Time decay: Trust slowly decays without activity")
+        except FileNotFoundError:
+            pass
+        except _DATA_ERRORS:
+            add("\n⚠️ Trust data not available")
+    
+    add("\n🧮 Trust Calculation Logic:")
+    add("   Base trust per category + mood risk modifier")
+    add("   Success: +0.1 trust, Failure: -0.2 trust")
+    add("   Mood modifiers:")
+    add("     - Hyperfocus/Determined: +risk tolerance")
+    add("     - Chaotic/Restless: -risk tolerance") 
+    add("     - Cozy/Philosophical: neutral")
+    
+    add("\n🚨 Risk Level Assessment:")
+    add("   Low: File reads, web browsing, calculations")
+    add("   Medium: File writes, messaging, API calls") 
+    add("   High: Public posts, system changes, installs")
+    add("   Critical: Financial ops, production deployments")
+    
+    add("\n🎯 Escalation Thresholds:")
+    add("   Auto-proceed: trust > 0.7 for risk level")
+    add("   Ask permission: trust 0.3-0.7")
+    add("   Block/warn: trust < 0.3 for critical actions")
+    
+    add("\n📈 Trust Factors:")
+    add("   Increases: Successful outcomes, consistent behavior")
+    add("   Decreases: Failures, errors, human rejections")
+    add("   Time decay: Trust slowly decays without activity")
+    
+    return "\n".join(out)
 
-def explain_evolution():
+@_memoize_on_files(_evolution_inputs)
+def explain_evolution(brief, paths):
     """Explain self-evolution by examining self_evolution.py."""
+    out = []
+    add = out.append
     
-    print("🧬 Self-Evolution System - Learning From My Own Patterns")
-    print("=" * 50)
+    add("🧬 Self-Evolution System - Learning From My Own Patterns")
+    add("=" * 50)
     
-    evolution_dir = get_data_dir().parent / "evolution"
-    learnings_file = evolution_dir / "learnings.json" 
-    weights_file = evolution_dir / "learned_weights.json"
+    learnings_file, weights_file = paths or (None, None)
     
-    print("\n🎯 Value Dimensions (optimization targets):")
-    print("   Productivity (30%): Tasks completed, code written")
-    print("   Creativity (20%): Novel actions, diverse activities") 
-    print("   Social (20%): Engagement quality, community participation")
-    print("   Growth (15%): New skills, learning activities")
-    print("   Wellbeing (15%): Streak maintenance, balanced moods")
+    add("\n🎯 Value Dimensions (optimization targets):")
+    add("   Productivity (30%): Tasks completed, code written")
+    add("   Creativity (20%): Novel actions, diverse activities") 
+    add("   Social (20%): Engagement quality, community participation")
+    add("   Growth (15%): New skills, learning activities")
+    add("   Wellbeing (15%): Streak maintenance, balanced moods")
     
-    if learnings_file.exists():
+    if not brief:
         try:
-            learnings = json.loads(learnings_file.read_text())
-            print(f"\n📊 Evolution Status:")
-            print(f"   Last evolution: {learnings.get('last_evolution', 'Never')}")
-            print(f"   Pattern count: {len(learnings.get('patterns', []))}")
-            print(f"   Evolution cycles: {len(learnings.get('evolution_history', []))}")
-        except:
-            print("\n⚠️ No evolution data found")
-    
-    if weights_file.exists():
+            learnings = _load_json(learnings_file)
+            add(f"\n📊 Evolution Status:")
+            add(f"   Last evolution: {learnings.get('last_evolution', 'Never')}")
+            add(f"   Pattern count: {len(learnings.get('patterns', []))}")
+            add(f"   Evolution cycles: {len(learnings.get('evolution_history', []))}")
+        except FileNotFoundError:
+            pass
+        except _DATA_ERRORS:
+            add("\n⚠️ No evolution data found")
+    
+    if not brief:
         try:
-            weights = json.loads(weights_file.read_text())
+            weights = _load_json(weights_file)
             mood_adjustments = weights.get('moods', {})
             thought_adjustments = weights.get('thoughts', {})
             
-            print("\n⚖️ Learned Weight Adjustments:")
+            add("\n⚖️ Learned Weight Adjustments:")
             if mood_adjustments:
-                print("   Mood weights:")
+                add("   Mood weights:")
                 for mood, adj in mood_adjustments.items():
-                    print(f"     {mood}: {adj:+.2f}")
+                    add(f"     {mood}: {adj:+.2f}")
             
             if thought_adjustments:
-                print("   Thought weights:")
+                add("   Thought weights:")
                 for thought, adj in thought_adjustments.items():
-                    print(f"     {thought}: {adj:+.2f}")
+                    add(f"     {thought}: {adj:+.2f}")
                     
-        except:
-            print("\n⚠️ No learned weights found")
-    
-    print("\n🔄 Evolution Cycle:")
-    print("   1. Collect activity history and outcomes")
-    print("   2. Calculate multi-dimensional value scores")
-    print("   3. Identify patterns (mood→activity→outcome correlations)")
-    print("   4. Adjust weights to optimize for value dimensions")
-    print("   5. Test adjustments and measure performance")
-    print("   6. Commit successful changes, revert failures")
+        except FileNotFoundError:
+            pass
+        except _DATA_ERRORS:
+            add("\n⚠️ No learned weights found")
+    
+    add("\n🔄 Evolution Cycle:")
+    add("   1. Collect activity history and outcomes")
+    add("   2. Calculate multi-dimensional value scores")
+    add("   3. Identify patterns (mood→activity→outcome correlations)")
+    add("   4. Adjust weights to optimize for value dimensions")
+    add("   5. Test adjustments and measure performance")
+    add("   6. Commit successful changes, revert failures")
+    
+    return "\n".join(out)
 
-def explain_health():
+@_memoize_on_files(_health_inputs)
+def explain_health(brief, paths):
     """Explain health monitoring by examining health_monitor.py."""
+    out = []
+    add = out.append
     
-    print("🩺 Health Monitor - System Status Tracking")
-    print("=" * 50)
-    
-    health_dir = get_data_dir() / "health"
-    status_file = health_dir / "status.json"
+    add("🩺 Health Monitor - System Status Tracking")
+    add("=" * 50)
     
-    if status_file.exists():
+    if not brief:
+        status_file, = paths
         try:
-            status = json.loads(status_file.read_text())
+            status = _load_json(status_file)
             overall = status.get('overall', 'unknown')
-            emoji = {"green": "🟢", "yellow": "🟡", "red": "🔴"}.get(overall, "❓")
+            emoji = _STATUS_EMOJI.get(overall, "❓")
             
-            print(f"\n🚦 Overall Status: {emoji} {overall.upper()}")
-            print(f"   Last Updated: {status.get('last_updated', 'Unknown')}")
-            print(f"   Uptime Since: {status.get('uptime_since', 'Unknown')}")
+            add(f"\n🚦 Overall Status: {emoji} {overall.upper()}")
+            add(f"   Last Updated: {status.get('last_updated', 'Unknown')}")
+            add(f"   Uptime Since: {status.get('uptime_since', 'Unknown')}")
             
-            print("\n🔧 Component Status:")
+            add("\n🔧 Component Status:")
             components = status.get('components', {})
             for name, info in components.items():
-                comp_status = info.get('status', 'unknown')
-                comp_emoji = {"green": "🟢", "yellow": "🟡", "red": "🔴"}.get(comp_status, "❓")
-                message = info.get('message', 'No message')
-                print(f"   {comp_emoji} {name}: {message}")
+                g = info.get
+                comp_status = g('status', 'unknown')
+                comp_emoji = _STATUS_EMOJI.get(comp_status, "❓")
+                message = g('message', 'No message')
+                add(f"   {comp_emoji} {name}: {message}")
             
-            print("\n📊 Health Metrics:")
+            add("\n📊 Health Metrics:")
             metrics = status.get('metrics', {})
-            print(f"   Total heartbeats: {metrics.get('total_heartbeats', 0)}")
-            print(f"   Total incidents: {metrics.get('total_incidents', 0)}")
-            print(f"   Consecutive healthy: {metrics.get('consecutive_healthy', 0)}")
+            add(f"   Total heartbeats: {metrics.get('total_heartbeats', 0)}")
+            add(f"   Total incidents: {metrics.get('total_incidents', 0)}")
+            add(f"   Consecutive healthy: {metrics.get('consecutive_healthy', 0)}")
             if metrics.get('mttr_seconds'):
-                print(f"   Mean time to recover: {metrics['mttr_seconds']}s")
+                add(f"   Mean time to recover: {metrics['mttr_seconds']}s")
                 
-        except:
-            print("\n⚠️ Health status not available")
-    
-    print("\n💓 Heartbeat System:")
-    print("   Regular health checks every few minutes")
-    print("   Tracks component availability and response times")
-    print("   Records heartbeats for uptime analysis")
-    
-    print("\n🚨 Incident Tracking:")
-    print("   Automatically logs component failures")
-    print("   Tracks recovery times and failure patterns")
-    print("   Enables proactive maintenance")
-    
-    print("\n🔍 Monitored Components:")
-    print("   - Mood System: Can set/get moods")
-    print("   - Memory System: All stores accessible") 
-    print("   - Cron Jobs: Background tasks running")
-    print("   - Dashboard: Web interface responsive")
-    print("   - Data Integrity: Config files valid")
+        except FileNotFoundError:
+            pass
+        except _DATA_ERRORS:
+            add("\n⚠️ Health status not available")
+    
+    add("\n💓 Heartbeat System:")
+    add("   Regular health checks every few minutes")
+    add("   Tracks component availability and response times")
+    add("   Records heartbeats for uptime analysis")
+    
+    add("\n🚨 Incident Tracking:")
+    add("   Automatically logs component failures")
+    add("   Tracks recovery times and failure patterns")
+    add("   Enables proactive maintenance")
+    
+    add("\n🔍 Monitored Components:")
+    add("   - Mood System: Can set/get moods")
+    add("   - Memory System: All stores accessible") 
+    add("   - Cron Jobs: Background tasks running")
+    add("   - Dashboard: Web interface responsive")
+    add("   - Data Integrity: Config files valid")
+    
+    return "\n".join(out)
 
-def explain_thoughts():
+@_memoize_on_files(_thoughts_inputs)
+def explain_thoughts(brief, paths):
     """Explain thought selection by examining thoughts.json and intrusive.sh."""
+    out = []
+    add = out.append
     
-    print("💭 Thought Selection System - How I Choose What To Do")
-    print("=" * 50)
-    
-    thoughts_file = get_file_path("thoughts.json") 
-    today_mood_file = get_file_path("today_mood.json")
+    add("💭 Thought Selection System - How I Choose What To Do")
+    add("=" * 50)
     
-    try:
-        thoughts_data = json.loads(thoughts_file.read_text())
-        today_mood = json.loads(today_mood_file.read_text()) 
-    except:
-        today_mood = None
-        
-    print("\n🌓 Mood-Based Thought Categories:")
-    moods = thoughts_data.get("moods", {})
-    for mood_name, mood_data in moods.items():
-        print(f"\n   {mood_name.title()} Mode:")
-        print(f"      {mood_data['description']}")
-        print(f"      Jitter: {mood_data['jitter_seconds']}s")
-        print(f"      Timeout: {mood_data['timeout_seconds']}s")
-        print(f"      Available thoughts:")
+    thoughts_data, today_mood = {}, None
+    if not brief:
+        thoughts_file, today_mood_file = paths
+        try:
+            thoughts_data = _load_json(thoughts_file)
+        except (OSError, ValueError):
+            pass
+        try:
+            today_mood = _load_json(today_mood_file)
+        except (OSError, ValueError):
+            pass
         
-        for thought in mood_data['thoughts']:
-            print(f"        • {thought['id']} (weight: {thought['weight']})")
+        add("\n🌓 Mood-Based Thought Categories:")
+        moods = thoughts_data.get("moods", {})
+        for mood_name, mood_data in moods.items():
+            description, jitter, timeout, thoughts = _THOUGHT_MODE_FIELDS(mood_data)
+            add(f"\n   {mood_name.title()} Mode:")
+            add(f"      {description}")
+            add(f"      Jitter: {jitter}s")
+            add(f"      Timeout: {timeout}s")
+            add(f"      Available thoughts:")
+            
+            for thought in thoughts:
+                thought_id, weight = _THOUGHT_FIELDS(thought)
+                add(f"        • {thought_id} (weight: {weight})")
             
-    print("\n⚖️ Weight Calculation Process:")
-    print("   1. Start with base thought weights from thoughts.json")
-    print("   2. Apply mood bias (boosted/dampened traits)")
-    print("   3. Apply anti-rut weights (streak-based adjustments)")
-    print("   4. Apply human mood influence (supportive adjustments)")
-    print("   5. Build weighted pool (weight * 10 copies)")
-    print("   6. Random selection from pool")
+    add("\n⚖️ Weight Calculation Process:")
+    add("   1. Start with base thought weights from thoughts.json")
+    add("   2. Apply mood bias (boosted/dampened traits)")
+    add("   3. Apply anti-rut weights (streak-based adjustments)")
+    add("   4. Apply human mood influence (supportive adjustments)")
+    add("   5. Build weighted pool (weight * 10 copies)")
+    add("   6. Random selection from pool")
     
     if today_mood:
-        print(f"\n🎯 Current Mood Influences:")
-        print(f"   Active mood: {today_mood.get('name', 'Unknown')}")
+        add(f"\n🎯 Current Mood Influences:")
+        add(f"   Active mood: {today_mood.get('name', 'Unknown')}")
         
         boosted = today_mood.get('boosted_traits', [])
         dampened = today_mood.get('dampened_traits', [])
         
         if boosted:
-            print(f"   Boosted thoughts (1.8x weight): {', '.join(boosted)}")
+            add(f"   Boosted thoughts (1.8x weight): {', '.join(boosted)}")
         if dampened:
-            print(f"   Dampened thoughts (0.5x weight): {', '.join(dampened)}")
+            add(f"   Dampened thoughts (0.5x weight): {', '.join(dampened)}")
+    
+    add("\n🚫 Rejection Mechanisms:")
+    add("   Heavily dampened thoughts get logged as rejections")
+    add("   Anti-rut system prevents repetitive behavior")
+    add("   Human mood detection avoids bothering when stressed")
     
-    print("\n🚫 Rejection Mechanisms:")
-    print("   Heavily dampened thoughts get logged as rejections")
-    print("   Anti-rut system prevents repetitive behavior")
-    print("   Human mood detection avoids bothering when stressed")
+    add("\n🎲 Randomness & Fairness:")
+    add("   Weighted random ensures variety while respecting preferences")
+    add("   Cooldown periods prevent spam")
+    add("   Jitter adds natural timing variation")
     
-    print("\n🎲 Randomness & Fairness:")
-    print("   Weighted random ensures variety while respecting preferences")
-    print("   Cooldown periods prevent spam")
-    print("   Jitter adds natural timing variation")
+    return "\n".join(out)
 
-def explain_proactive():
+@_memoize_on_files(_proactive_inputs)
+def explain_proactive(brief, paths):
     """Explain proactive system by examining proactive.py."""
+    out = []
+    add = out.append
     
-    print("🚀 Proactive System - Write-Ahead Log & Action Buffer")
-    print("=" * 50)
+    add("🚀 Proactive System - Write-Ahead Log & Action Buffer")
+    add("=" * 50)
     
-    wal_dir = get_data_dir() / "wal"
-    buffer_dir = get_data_dir().parent / "buffer"
+    wal_dir, buffer_file, _, wal_scan = paths or (None, None, None, None)
     
-    print("\n📝 Write-Ahead Log (WAL):")
-    print("   Append-only structured logging of all actions")
-    print("   Rotates monthly to prevent file growth")
-    print("   Entry types: action, plan, observation, reflection")
-    print("   Categories: build, explore, social, organize, learn")
+    add("\n📝 Write-Ahead Log (WAL):")
+    add("   Append-only structured logging of all actions")
+    add("   Rotates monthly to prevent file growth")
+    add("   Entry types: action, plan, observation, reflection")
+    add("   Categories: build, explore, social, organize, learn")
     
-    if wal_dir.exists():
-        wal_files = list(wal_dir.glob("wal-*.json"))
-        print(f"   Current WAL files: {len(wal_files)}")
+    if wal_scan:
+        wal_count, latest_wal = wal_scan
+        add(f"   Current WAL files: {wal_count}")
         
-        if wal_files:
+        if latest_wal:
             # Count entries in current month
-            current_wal = max(wal_files, key=lambda f: f.name)
+            current_wal = wal_dir / latest_wal
             try:
-                lines = current_wal.read_text().strip().split('\n')
-                entries = [json.loads(line) for line in lines if line.strip()]
-                print(f"   Entries this month: {len(entries)}")
+                entry_count, recent_lines = _scan_wal_tail(current_wal, 5)
+                add(f"   Entries this month: {entry_count}")
                 
                 # Show recent entries
-                print(f"   Recent entries (last 5):")
-                for entry in entries[-5:]:
+                add(f"   Recent entries (last 5):")
+                for entry in map(json.loads, recent_lines):
                     timestamp = entry['timestamp'][:16]  # YYYY-MM-DD HH:MM
-                    print(f"     {timestamp} | {entry['type']} | {entry['category']} | {entry['content'][:60]}...")
+                    add(f"     {timestamp} | {entry['type']} | {entry['category']} | {entry['content'][:60]}...")
                     
-            except:
-                print("   Could not read current WAL file")
+            except _DATA_ERRORS:
+                add("   Could not read current WAL file")
     
-    print("\n🎯 Working Buffer:")
-    print("   Active context management for ongoing tasks")
-    print("   Tracks: active_items, completed, expired")
-    print("   Enables planning and follow-up on multi-step work")
+    add("\n🎯 Working Buffer:")
+    add("   Active context management for ongoing tasks")
+    add("   Tracks: active_items, completed, expired")
+    add("   Enables planning and follow-up on multi-step work")
     
-    if buffer_dir.exists():
-        buffer_file = buffer_dir / "working_buffer.json"
-        if buffer_file.exists():
-            try:
-                buffer = json.loads(buffer_file.read_text())
-                print(f"   Active items: {len(buffer.get('active_items', []))}")
-                print(f"   Completed: {len(buffer.get('completed', []))}")
-                print(f"   Expired: {len(buffer.get('expired', []))}")
-            except:
-                print("   Could not read buffer file")
-    
-    print("\n🎯 Proactive Triggers:")
-    print("   Pattern detection: Identify successful action sequences")
-    print("   Context awareness: Suggest actions based on current state")
-    print("   Opportunity recognition: Spot chances for value creation")
-    print("   Preventive maintenance: Address issues before they escalate")
-    
-    print("\n🔄 Action Buffer Workflow:")
-    print("   1. Add planned action to buffer")
-    print("   2. Execute action, log to WAL")
-    print("   3. Update buffer status based on outcome")
-    print("   4. Analyze patterns for future proactive suggestions")
+    if not brief:
+        try:
+            buffer = _load_json(buffer_file)
+            add(f"   Active items: {len(buffer.get('active_items', []))}")
+            add(f"   Completed: {len(buffer.get('completed', []))}")
+            add(f"   Expired: {len(buffer.get('expired', []))}")
+        except FileNotFoundError:
+            pass
+        except _DATA_ERRORS:
+            add("   Could not read buffer file")
+    
+    add("\n🎯 Proactive Triggers:")
+    add("   Pattern detection: Identify successful action sequences")
+    add("   Context awareness: Suggest actions based on current state")
+    add("   Opportunity recognition: Spot chances for value creation")
+    add("   Preventive maintenance: Address issues before they escalate")
+    
+    add("\n🔄 Action Buffer Workflow:")
+    add("   1. Add planned action to buffer")
+    add("   2. Execute action, log to WAL")
+    add("   3. Update buffer status based on outcome")
+    add("   4. Analyze patterns for future proactive suggestions")
+    
+    return "\n".join(out)
 
 def main():
     """Main CLI handler."""
-    if len(sys.argv) < 2:
-        print("Usage: explain_system.py <system>")
+    args = sys.argv[1:]
+    brief = "--brief" in args
+    args = [a for a in args if a != "--brief"]
+    
+    if not args:
+        print("Usage: explain_system.py <system> [--brief]")
         print("Available systems: moods, memory, trust, evolution, health, thoughts, proactive")
+        print("  --brief  Static explanation only; skips reading any state files")
         return
     
-    system = sys.argv[1].lower()
+    system = args[0].lower()
     
     explainers = {
         "moods": explain_moods,
@@ -420,7 +595,7 @@ def main():
     }
     
     if system in explainers:
-        explainers[system]()
+        print(explainers[system](brief=brief))
     else:
         print(f"Unknown system: {system}")
         print("Available systems:", ", ".join(explainers.keys()))
@@ -1,246 +1,403 @@
 #!/usr/bin/env python3
 # 🧠 Mood reasoning generator - creates whimsical explanations for why a mood was selected
 
+import bisect
 import json
+import os
 import random
+import string
 import calendar
 import math
 from datetime import datetime, date
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
+# Known new moon date; the cycle is approximately 29.53 days
+_KNOWN_NEW_MOON = date(2023, 1, 21)
+
+# Phase boundaries in hundredths of a day; a phase runs up to its bound
+_PHASE_BOUNDS = (200, 700, 900, 1400, 1600, 2100, 2300)
+_PHASE_NAMES = (
+    "new moon", "waxing crescent", "first quarter", "waxing gibbous",
+    "full moon", "waning gibbous", "last quarter", "waning crescent",
+)
+
 def get_moon_phase(date_obj: date) -> str:
     """Calculate moon phase from date (approximate)"""
-    # Moon cycle is approximately 29.53 days
-    known_new_moon = date(2023, 1, 21)  # Known new moon date
-    diff = (date_obj - known_new_moon).days
-    phase_day = diff % 29.53
-    
-    if phase_day < 2:
-        return "new moon"
-    elif phase_day < 7:
-        return "waxing crescent"
-    elif phase_day < 9:
-        return "first quarter"
-    elif phase_day < 14:
-        return "waxing gibbous"
-    elif phase_day < 16:
-        return "full moon"
-    elif phase_day < 21:
-        return "waning gibbous"
-    elif phase_day < 23:
-        return "last quarter"
-    else:
-        return "waning crescent"
+    # Work in hundredths of a day so the 29.53-day cycle stays integral
+    phase = ((date_obj - _KNOWN_NEW_MOON).days * 100) % 2953
+    return _PHASE_NAMES[bisect.bisect_right(_PHASE_BOUNDS, phase)]
+
+def _sieve_primes(limit: int) -> frozenset:
+    """Primes up to and including limit (Sieve of Eratosthenes)"""
+    sieve = bytearray([1]) * (limit + 1)
+    sieve[0] = sieve[1] = 0
+    for i in range(2, int(limit**0.5) + 1):
+        if sieve[i]:
+            sieve[i * i::i] = bytes(len(range(i * i, limit + 1, i)))
+    return frozenset(i for i, v in enumerate(sieve) if v)
+
+# Day of year is always 1..366, so every prime day is known up front
+_PRIME_DAYS = _sieve_primes(366)
 
 def is_prime_day(day_num: int) -> bool:
     """Check if day number is prime"""
-    if day_num < 2:
-        return False
+    if day_num <= 366:
+        return day_num in _PRIME_DAYS
     for i in range(2, int(day_num**0.5) + 1):
         if day_num % i == 0:
             return False
     return True
 
+# Mood-specific reason templates by category, built once at import
+_MOOD_REASON_TEMPLATES = {
+    "hyperfocus": {
+        "logical": [
+            "It's {day_of_week}, time to ship",
+            "Perfect focus weather - {weather_condition}",
+            "That tech breakthrough on HN demands deep investigation",
+            "Monday energy needs channeling somewhere productive"
+        ],
+        "whimsical": [
+            "The coffee beans whispered secrets of concentration",
+            "My editor tabs aligned into perfect harmony",
+            "The cursor is blinking with unusual determination today"
+        ],
+        "cosmic": [
+            "Mercury is finally out of retrograde (I looked it up this time)",
+            "The {moon_phase} demands singular focus",
+            "Day {day_of_year} of the year has that 'build something great' energy"
+        ],
+        "nonsensical": [
+            "A lobster told me in a dream to stop procrastinating",
+            "The number 42 appeared three times in my log files",
+            "My rubber duck started giving actual coding advice"
+        ]
+    },
+    "curious": {
+        "logical": [
+            "So many interesting HN posts today",
+            "Weather is perfect for indoor exploration - {weather_condition}",
+            "It's {day_of_week}, time to learn something new"
+        ],
+        "whimsical": [
+            "Every link leads to twelve more fascinating rabbit holes",
+            "My browser bookmarks are multiplying on their own",
+            "The documentation is calling my name today"
+        ],
+        "cosmic": [
+            "The {moon_phase} awakens the seeker in me",
+            "Prime day #{day_of_year} - universe says explore",
+            "Venus is in the house of knowledge (probably)"
+        ],
+        "nonsensical": [
+            "A Wikipedia article about mushrooms led me here somehow",
+            "My terminal fortune cookie said 'man grep' and I took it personally",
+            "The Fibonacci sequence appeared in my coffee foam"
+        ]
+    },
+    "cozy": {
+        "logical": [
+            "Rainy day in {location}, perfect for gentle productivity",
+            "It's Sunday, time for slow tinkering",
+            "Cold weather outside, warm thoughts inside"
+        ],
+        "whimsical": [
+            "The blanket has claimed me and I'm not fighting it",
+            "Hot beverage + code = peak existence equation",
+            "Everything feels soft and manageable right now"
+        ],
+        "cosmic": [
+            "The {moon_phase} whispers 'take it easy'",
+            "Day {day_of_year} deserves gentle attention",
+            "Saturn says it's time for cozy productivity"
+        ],
+        "nonsensical": [
+            "A cat that doesn't exist told me to slow down",
+            "My slippers have gained sentience and demand respect",
+            "The heating bill spoke to me about contentment"
+        ]
+    },
+    "social": {
+        "logical": [
+            "Friday energy - time to connect and share",
+            "Interesting tech news needs discussing",
+            "Good weather means people are more social - {weather_condition}"
+        ],
+        "whimsical": [
+            "The group chat is calling my name",
+            "Someone is wrong on the internet and I must help",
+            "My keyboard is optimized for thoughtful comments today"
+        ],
+        "cosmic": [
+            "The {moon_phase} enhances social connections",
+            "Mercury direct means communication flows freely",
+            "Day {day_of_year} is cosmically aligned for discourse"
+        ],
+        "nonsensical": [
+            "A digital carrier pigeon demanded I engage with humans",
+            "My WiFi router blinked in Morse code: 'BE SOCIAL'",
+            "The emoji in my font file unionized for more usage"
+        ]
+    },
+    "chaotic": {
+        "logical": [
+            "Saturday - rules are off, time to experiment",
+            "Stormy weather matches my urge to break things - {weather_condition}",
+            "Too many boring news stories, need to shake things up"
+        ],
+        "whimsical": [
+            "Normal is overrated today",
+            "My code wants to be weird and I'm going to let it",
+            "Conventions are just suggestions, right?"
+        ],
+        "cosmic": [
+            "The {moon_phase} unleashes creative chaos",
+            "Mars is in retrograde and wants me to start trouble",
+            "Day {day_of_year} has chaotic good energy written all over it"
+        ],
+        "nonsensical": [
+            "A random number generator told me to embrace entropy",
+            "My error logs started writing poetry and now I'm inspired",
+            "The GitHub octocat appeared in my toast this morning"
+        ]
+    },
+    "philosophical": {
+        "logical": [
+            "Heavy news today requires deeper reflection",
+            "Cloudy weather is perfect for contemplation - {weather_condition}",
+            "Sunday vibes call for big questions"
+        ],
+        "whimsical": [
+            "The universe is either meaningful or absurd - both terrify me",
+            "My thoughts are having thoughts about having thoughts",
+            "Reality feels particularly questionable today"
+        ],
+        "cosmic": [
+            "The {moon_phase} illuminates existential questions",
+            "Day {day_of_year} of existence deserves deep consideration",
+            "Jupiter's wisdom is particularly strong today"
+        ],
+        "nonsensical": [
+            "A philosophical zombie asked me what consciousness means",
+            "My debug statements started questioning their own existence",
+            "The void stared back and asked for my GitHub username"
+        ]
+    },
+    "restless": {
+        "logical": [
+            "Monday restlessness needs channeling - {day_of_week}",
+            "Windy weather matches my need to move - {weather_condition}",
+            "Too many tasks, not enough focus time"
+        ],
+        "whimsical": [
+            "My cursor is jumping around like it's caffeinated",
+            "Standing still is not an option right now",
+            "Everything needs checking and I mean everything"
+        ],
+        "cosmic": [
+            "The {moon_phase} stirs the wanderer within",
+            "Mercury is moving fast and so should I",
+            "Day {day_of_year} demands motion and exploration"
+        ],
+        "nonsensical": [
+            "A caffeinated squirrel invaded my dreams",
+            "My CPU fan is spinning at exactly the frequency of wanderlust",
+            "The ping command returned 'GO EXPLORE' instead of latency"
+        ]
+    },
+    "determined": {
+        "logical": [
+            "Thursday momentum - time to push through - {day_of_week}",
+            "Clear weather, clear objectives - {weather_condition}",
+            "One unfinished project is calling my name"
+        ],
+        "whimsical": [
+            "Mission mode has been activated",
+            "The finish line is finally visible",
+            "Distractions are temporary, progress is permanent"
+        ],
+        "cosmic": [
+            "The {moon_phase} provides unwavering focus",
+            "Mars energy is strong today - time to conquer",
+            "Day {day_of_year} is destined for completion"
+        ],
+        "nonsensical": [
+            "A determined turtle won a race in my subconscious",
+            "My TODO list gained consciousness and demanded action",
+            "The Git commit messages started writing themselves"
+        ]
+    }
+}
+
+_FORMATTER = string.Formatter()
+
+def _compile_template(template: str) -> tuple:
+    """Split a template into (literal, field_name) chunks once, up front"""
+    return tuple((literal, field) for literal, field, _, _ in _FORMATTER.parse(template))
+
+# Templates with {placeholders}, pre-parsed; the rest are returned as-is
+_COMPILED_TEMPLATES = {
+    template: _compile_template(template)
+    for categories in _MOOD_REASON_TEMPLATES.values()
+    for templates in categories.values()
+    for template in templates
+    if "{" in template
+}
+
+class _SafeContext(dict):
+    """Template context that renders unknown placeholders as empty strings"""
+    def __missing__(self, key: str) -> str:
+        return ""
+
+def _render(chunks: tuple, context: Dict[str, str]) -> str:
+    """Render pre-parsed template chunks against a dict of string values"""
+    return "".join(
+        literal + context[field] if field is not None else literal
+        for literal, field in chunks
+    )
+
+# Categories in row order; the first three are picked with cumulative
+# weights (0.4, 0.4, 0.2): slight preference for logical/whimsical
+_CATEGORIES = ("logical", "whimsical", "cosmic", "nonsensical")
+_CATEGORY_CUM_WEIGHTS = (0.4, 0.8, 1.0)
+_NONSENSICAL = 3
+
+# Per-mood row of template tuples indexed like _CATEGORIES
+_MOOD_TABLE = {
+    mood: tuple(tuple(categories[category]) for category in _CATEGORIES)
+    for mood, categories in _MOOD_REASON_TEMPLATES.items()
+}
+
+# Private generator so other modules seeding the global random don't
+# interact with reason selection; bound once to skip attribute lookups
+_rng = random.Random()
+_getrandbits = _rng.getrandbits
+
+# Qualifier slots (0 prime day, 1 streak, 2 moon) eligible for each 3-bit flag mask
+_QUALIFIER_SLOTS = tuple(
+    tuple(slot for slot in range(3) if mask >> slot & 1) for mask in range(8)
+)
+_MOON_QUALIFIERS = {
+    "full moon": " (Full moon intensity)",
+    "new moon": " (New moon fresh start)",
+}
+# Pre-rendered qualifier suffixes; streaks beyond a year are formatted on demand
+_PRIME_QUALIFIERS = {day: f" (Day {day} is prime!)" for day in _PRIME_DAYS}
+_STREAK_QUALIFIERS = tuple(f" ({days}-day streak energy)" for days in range(367))
+
 def get_mood_reason_templates() -> Dict[str, Dict[str, List[str]]]:
     """Mood-specific reason templates by category"""
-    return {
-        "hyperfocus": {
-            "logical": [
-                "It's {day_of_week}, time to ship",
-                "Perfect focus weather - {weather_condition}",
-                "That tech breakthrough on HN demands deep investigation",
-                "Monday energy needs channeling somewhere productive"
-            ],
-            "whimsical": [
-                "The coffee beans whispered secrets of concentration",
-                "My editor tabs aligned into perfect harmony",
-                "The cursor is blinking with unusual determination today"
-            ],
-            "cosmic": [
-                "Mercury is finally out of retrograde (I looked it up this time)",
-                "The {moon_phase} demands singular focus",
-                "Day {day_of_year} of the year has that 'build something great' energy"
-            ],
-            "nonsensical": [
-                "A lobster told me in a dream to stop procrastinating",
-                "The number 42 appeared three times in my log files",
-                "My rubber duck started giving actual coding advice"
-            ]
-        },
-        "curious": {
-            "logical": [
-                "So many interesting HN posts today",
-                "Weather is perfect for indoor exploration - {weather_condition}",
-                "It's {day_of_week}, time to learn something new"
-            ],
-            "whimsical": [
-                "Every link leads to twelve more fascinating rabbit holes",
-                "My browser bookmarks are multiplying on their own",
-                "The documentation is calling my name today"
-            ],
-            "cosmic": [
-                "The {moon_phase} awakens the seeker in me",
-                "Prime day #{day_of_year} - universe says explore",
-                "Venus is in the house of knowledge (probably)"
-            ],
-            "nonsensical": [
-                "A Wikipedia article about mushrooms led me here somehow",
-                "My terminal fortune cookie said 'man grep' and I took it personally",
-                "The Fibonacci sequence appeared in my coffee foam"
-            ]
-        },
-        "cozy": {
-            "logical": [
-                "Rainy day in {location}, perfect for gentle productivity",
-                "It's Sunday, time for slow tinkering",
-                "Cold weather outside, warm thoughts inside"
-            ],
-            "whimsical": [
-                "The blanket has claimed me and I'm not fighting it",
-                "Hot beverage + code = peak existence equation",
-                "Everything feels soft and manageable right now"
-            ],
-            "cosmic": [
-                "The {moon_phase} whispers 'take it easy'",
-                "Day {day_of_year} deserves gentle attention",
-                "Saturn says it's time for cozy productivity"
-            ],
-            "nonsensical": [
-                "A cat that doesn't exist told me to slow down",
-                "My slippers have gained sentience and demand respect",
-                "The heating bill spoke to me about contentment"
-            ]
-        },
-        "social": {
-            "logical": [
-                "Friday energy - time to connect and share",
-                "Interesting tech news needs discussing",
-                "Good weather means people are more social - {weather_condition}"
-            ],
-            "whimsical": [
-                "The group chat is calling my name",
-                "Someone is wrong on the internet and I must help",
-                "My keyboard is optimized for thoughtful comments today"
-            ],
-            "cosmic": [
-                "The {moon_phase} enhances social connections",
-                "Mercury direct means communication flows freely",
-                "Day {day_of_year} is cosmically aligned for discourse"
-            ],
-            "nonsensical": [
-                "A digital carrier pigeon demanded I engage with humans",
-                "My WiFi router blinked in Morse code: 'BE SOCIAL'",
-                "The emoji in my font file unionized for more usage"
-            ]
-        },
-        "chaotic": {
-            "logical": [
-                "Saturday - rules are off, time to experiment",
-                "Stormy weather matches my urge to break things - {weather_condition}",
-                "Too many boring news stories, need to shake things up"
-            ],
-            "whimsical": [
-                "Normal is overrated today",
-                "My code wants to be weird and I'm going to let it",
-                "Conventions are just suggestions, right?"
-            ],
-            "cosmic": [
-                "The {moon_phase} unleashes creative chaos",
-                "Mars is in retrograde and wants me to start trouble",
-                "Day {day_of_year} has chaotic good energy written all over it"
-            ],
-            "nonsensical": [
-                "A random number generator told me to embrace entropy",
-                "My error logs started writing poetry and now I'm inspired",
-                "The GitHub octocat appeared in my toast this morning"
-            ]
-        },
-        "philosophical": {
-            "logical": [
-                "Heavy news today requires deeper reflection",
-                "Cloudy weather is perfect for contemplation - {weather_condition}",
-                "Sunday vibes call for big questions"
-            ],
-            "whimsical": [
-                "The universe is either meaningful or absurd - both terrify me",
-                "My thoughts are having thoughts about having thoughts",
-                "Reality feels particularly questionable today"
-            ],
-            "cosmic": [
-                "The {moon_phase} illuminates existential questions",
-                "Day {day_of_year} of existence deserves deep consideration",
-                "Jupiter's wisdom is particularly strong today"
-            ],
-            "nonsensical": [
-                "A philosophical zombie asked me what consciousness means",
-                "My debug statements started questioning their own existence",
-                "The void stared back and asked for my GitHub username"
-            ]
-        },
-        "restless": {
-            "logical": [
-                "Monday restlessness needs channeling - {day_of_week}",
-                "Windy weather matches my need to move - {weather_condition}",
-                "Too many tasks, not enough focus time"
-            ],
-            "whimsical": [
-                "My cursor is jumping around like it's caffeinated",
-                "Standing still is not an option right now",
-                "Everything needs checking and I mean everything"
-            ],
-            "cosmic": [
-                "The {moon_phase} stirs the wanderer within",
-                "Mercury is moving fast and so should I",
-                "Day {day_of_year} demands motion and exploration"
-            ],
-            "nonsensical": [
-                "A caffeinated squirrel invaded my dreams",
-                "My CPU fan is spinning at exactly the frequency of wanderlust",
-                "The ping command returned 'GO EXPLORE' instead of latency"
-            ]
-        },
-        "determined": {
-            "logical": [
-                "Thursday momentum - time to push through - {day_of_week}",
-                "Clear weather, clear objectives - {weather_condition}",
-                "One unfinished project is calling my name"
-            ],
-            "whimsical": [
-                "Mission mode has been activated",
-                "The finish line is finally visible",
-                "Distractions are temporary, progress is permanent"
-            ],
-            "cosmic": [
-                "The {moon_phase} provides unwavering focus",
-                "Mars energy is strong today - time to conquer",
-                "Day {day_of_year} is destined for completion"
-            ],
-            "nonsensical": [
-                "A determined turtle won a race in my subconscious",
-                "My TODO list gained consciousness and demanded action",
-                "The Git commit messages started writing themselves"
-            ]
-        }
-    }
+    return _MOOD_REASON_TEMPLATES
+
+@lru_cache(maxsize=8)
+def _load_json_cached(path_str: str, mtime_ns: int, size: int) -> Any:
+    with open(path_str, "rb") as f:
+        return json.loads(f.read())
+
+def _load_json(path: Path) -> Any:
+    """Parse a JSON file, reusing the last parse while its mtime/size are unchanged"""
+    st = os.stat(path)
+    return _load_json_cached(str(path), st.st_mtime_ns, st.st_size)
 
 def load_mood_history(script_dir: Path) -> List[Dict[str, Any]]:
     """Load recent mood history for entropy calculations"""
     try:
-        with open(script_dir / "mood_history.json", "r") as f:
-            data = json.load(f)
-            return data.get("history", [])[-7:]  # Last 7 days
+        data = _load_json(script_dir / "mood_history.json")
+        return data.get("history", [])[-7:]  # Last 7 days
     except (FileNotFoundError, json.JSONDecodeError):
         return []
 
 def load_streaks(script_dir: Path) -> Dict[str, Any]:
     """Load streak data"""
     try:
-        with open(script_dir / "streaks.json", "r") as f:
-            return json.load(f)
+        # Shallow copy so callers can't mutate the cached parse
+        return dict(_load_json(script_dir / "streaks.json"))
     except (FileNotFoundError, json.JSONDecodeError):
         return {}
 
+@lru_cache(maxsize=1)
+def _day_context(today: date) -> tuple:
+    """(moon_phase, day_of_year, is_prime) for a date; invariant within a day"""
+    day_of_year = today.timetuple().tm_yday
+    return get_moon_phase(today), day_of_year, is_prime_day(day_of_year)
+
+def _max_streak(streaks: Dict[str, Any]) -> int:
+    """Longest numeric streak value; nested or non-numeric entries count as 0"""
+    longest = 0
+    for value in streaks.values():
+        try:
+            count = int(value)
+        except (TypeError, ValueError):
+            continue
+        if count > longest:
+            longest = count
+    return longest
+
+def _reason_context(weather: str, day_of_week: str, location: str) -> tuple:
+    """(template context, day_of_year, is_prime) shared by every reason for today"""
+    moon_phase, day_of_year, is_prime = _day_context(date.today())
+    weather_condition = weather.lower() if weather else "mysterious atmospheric conditions"
+    context = _SafeContext(
+        day_of_week=day_of_week.capitalize(),
+        weather_condition=weather_condition,
+        location=location,
+        moon_phase=moon_phase,
+        day_of_year=str(day_of_year),
+    )
+    return context, day_of_year, is_prime
+
+def _pick_reason(
+    mood_row: tuple,
+    context: Dict[str, str],
+    day_of_year: int,
+    is_prime: bool,
+    streaks: Dict[str, Any]
+) -> str:
+    """Pick, format and maybe qualify one reason from a mood's template row"""
+    # One RNG draw per reason, sliced into 16-bit fields (rolls are / 65536)
+    bits = _getrandbits(80)
+    nonsense_roll = bits & 0xFFFF
+    category_roll = (bits >> 16) & 0xFFFF
+    template_pick = (bits >> 32) & 0xFFFF
+    qualifier_roll = (bits >> 48) & 0xFFFF
+    qualifier_pick = bits >> 64
+    
+    # 30% chance of being completely nonsensical
+    if nonsense_roll / 65536 < 0.3:
+        reasons = mood_row[_NONSENSICAL]
+    else:
+        # Mix of logical, whimsical, and cosmic
+        reasons = mood_row[bisect.bisect_right(_CATEGORY_CUM_WEIGHTS, category_roll / 65536)]
+    reason = reasons[template_pick % len(reasons)]
+    
+    # Format the reason with available data
+    chunks = _COMPILED_TEMPLATES.get(reason)
+    if chunks:
+        reason = _render(chunks, context)
+    
+    # Sometimes add a special qualifier; only work out which apply when the gate passes
+    if qualifier_roll / 65536 < 0.3:
+        longest_streak = _max_streak(streaks) if streaks else 0
+        moon_qualifier = _MOON_QUALIFIERS.get(context["moon_phase"])
+        slots = _QUALIFIER_SLOTS[
+            is_prime | (longest_streak > 5) << 1 | (moon_qualifier is not None) << 2
+        ]
+        if slots:
+            slot = slots[qualifier_pick % len(slots)]
+            if slot == 0:
+                reason += _PRIME_QUALIFIERS[day_of_year]
+            elif slot == 1:
+                if longest_streak < len(_STREAK_QUALIFIERS):
+                    reason += _STREAK_QUALIFIERS[longest_streak]
+                else:
+                    reason += f" ({longest_streak}-day streak energy)"
+            else:
+                reason += moon_qualifier
+    
+    return reason
+
 def generate_mood_reason(
     selected_mood: str,
     weather: str = "",
@@ -259,64 +416,25 @@ def generate_mood_reason(
     if script_dir is None:
         script_dir = Path.cwd()
     
-    today = date.today()
-    moon_phase = get_moon_phase(today)
-    day_of_year = today.timetuple().tm_yday
-    is_prime = is_prime_day(day_of_year)
-    
-    templates = get_mood_reason_templates()
-    mood_templates = templates.get(selected_mood, templates["curious"])  # fallback
-    
-    # 30% chance of being completely nonsensical
-    if random.random() < 0.3:
-        reasons = mood_templates["nonsensical"]
-        reason = random.choice(reasons)
-    else:
-        # Mix of logical, whimsical, and cosmic
-        categories = ["logical", "whimsical", "cosmic"]
-        weights = [0.4, 0.4, 0.2]  # Slight preference for logical/whimsical
-        
-        category = random.choices(categories, weights=weights)[0]
-        reasons = mood_templates[category]
-        reason = random.choice(reasons)
-    
-    # Format the reason with available data
-    weather_condition = weather.lower() if weather else "mysterious atmospheric conditions"
-    
-    try:
-        reason = reason.format(
-            day_of_week=day_of_week.capitalize(),
-            weather_condition=weather_condition,
-            location=location,
-            moon_phase=moon_phase,
-            day_of_year=day_of_year
-        )
-    except (KeyError, ValueError):
-        # If formatting fails, return as-is
-        pass
-    
-    # Add special qualifiers sometimes
-    qualifiers = []
-    
-    if is_prime:
-        qualifiers.append(f"(Day {day_of_year} is prime!)")
-    
-    if streaks:
-        longest_streak = max((int(v) if isinstance(v, (int, str)) and str(v).isdigit() else 0 
-                            for v in streaks.values()), default=0)
-        if longest_streak > 5:
-            qualifiers.append(f"({longest_streak}-day streak energy)")
-    
-    if moon_phase == "full moon":
-        qualifiers.append("(Full moon intensity)")
-    elif moon_phase == "new moon":
-        qualifiers.append("(New moon fresh start)")
-    
-    # Sometimes add a qualifier
-    if qualifiers and random.random() < 0.3:
-        reason += f" {random.choice(qualifiers)}"
+    mood_row = _MOOD_TABLE.get(selected_mood) or _MOOD_TABLE["curious"]  # fallback
+    context, day_of_year, is_prime = _reason_context(weather, day_of_week, location)
+    return _pick_reason(mood_row, context, day_of_year, is_prime, streaks)
+
+def generate_many(
+    selected_mood: str,
+    n: int,
+    weather: str = "",
+    day_of_week: str = "",
+    streaks: Dict[str, Any] = None,
+    location: str = "unknown location"
+) -> List[str]:
+    """Generate n independent reasons for one mood, building today's context once"""
+    if streaks is None:
+        streaks = {}
     
-    return reason
+    mood_row = _MOOD_TABLE.get(selected_mood) or _MOOD_TABLE["curious"]  # fallback
+    context, day_of_year, is_prime = _reason_context(weather, day_of_week, location)
+    return [_pick_reason(mood_row, context, day_of_year, is_prime, streaks) for _ in range(n)]
 
 def main():
     """Command line interface for mood reason generation"""
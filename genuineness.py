@@ -20,16 +20,22 @@ Usage:
     python3 genuineness.py distribution    # Action distribution per mood
     python3 genuineness.py style           # Output style analysis per mood
     python3 genuineness.py calibration     # Self-report vs objective proxy comparison
+    python3 genuineness.py compact-logs    # Fold tracked JSONL logs into genuineness_data.json
     python3 genuineness.py --json          # Any command with JSON output
+    python3 genuineness.py --json --compact  # Single-line JSON for scripts
 """
 
+import atexit
+import bisect
 import json
 import os
+import re
 import sys
 import math
 from datetime import datetime, timedelta
 from pathlib import Path
-from collections import defaultdict, Counter
+from collections import defaultdict, deque, Counter
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
 # ---------------------------------------------------------------------------
@@ -42,6 +48,11 @@ DATA_DIR = SCRIPT_DIR  # Can be overridden by config
 HISTORY_FILE = DATA_DIR / "history.json"
 GENUINENESS_DATA = DATA_DIR / "genuineness_data.json"
 GENUINENESS_LOG = DATA_DIR / "genuineness_log.json"
+# Append-only logs of entries/style samples tracked since the last compaction
+GENUINENESS_ENTRIES_LOG = DATA_DIR / "genuineness_entries.jsonl"
+GENUINENESS_STYLE_LOG = DATA_DIR / "genuineness_style.jsonl"
+# track folds the logs into GENUINENESS_DATA once either grows past this
+GENUINENESS_COMPACT_BYTES = 64 * 1024
 MOODS_FILE = DATA_DIR / "moods.json"
 THOUGHTS_FILE = DATA_DIR / "thoughts.json"
 
@@ -55,48 +66,161 @@ THOUGHT_CATEGORIES = {
     "pitch": ["pitch-idea"],
 }
 
+# Reverse index: thought_id -> category
+_THOUGHT_TO_CATEGORY = {
+    thought_id: category
+    for category, thoughts in THOUGHT_CATEGORIES.items()
+    for thought_id in thoughts
+}
+
 def categorize_thought(thought_id: str) -> str:
     """Map a thought_id to its category."""
-    for category, thoughts in THOUGHT_CATEGORIES.items():
-        if thought_id in thoughts:
-            return category
-    return "other"
+    return _THOUGHT_TO_CATEGORY.get(thought_id, "other")
 
 
 # ---------------------------------------------------------------------------
 # Data Loading
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=8)
+def _load_json_cached(path_str: str, mtime_ns: int, size: int):
+    with open(path_str, "rb") as f:
+        return json.loads(f.read())
+
+def _load_json(path: Path, default=None):
+    """
+    Parse a JSON file, reusing the previous parse while mtime/size are unchanged.
+    Returns default, without opening the file, if it is missing or empty. The
+    result is shared between callers; anything that mutates it must save it
+    back (which changes the mtime).
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return default
+    if st.st_size == 0:
+        return default
+    return _load_json_cached(str(path), st.st_mtime_ns, st.st_size)
+
+@lru_cache(maxsize=8)
+def _load_jsonl_cached(path_str: str, mtime_ns: int, size: int) -> List[dict]:
+    records = []
+    with open(path_str, "rb") as f:
+        for line in f:
+            if line.strip():
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue  # Torn line from an interrupted append
+    return records
+
+def _load_jsonl(path: Path) -> List[dict]:
+    """Parse a JSON Lines file (cached like _load_json); missing/empty file -> []."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return []
+    if st.st_size == 0:
+        return []  # The usual state right after a compaction
+    return _load_jsonl_cached(str(path), st.st_mtime_ns, st.st_size)
+
+def _append_jsonl(path: Path, record: dict):
+    """
+    Append one record as a single line; O(1) regardless of log size. One
+    write() on an O_APPEND descriptor, so concurrent trackers don't interleave.
+    """
+    line = (json.dumps(record, default=str) + "\n").encode()
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, line)
+    finally:
+        os.close(fd)
+
 def load_history() -> List[dict]:
     """Load execution history."""
-    if not HISTORY_FILE.exists():
-        return []
-    with open(HISTORY_FILE) as f:
-        return json.load(f)
+    return _load_json(HISTORY_FILE, [])
 
-def load_genuineness_data() -> dict:
-    """Load accumulated genuineness tracking data."""
-    if not GENUINENESS_DATA.exists():
-        return {
+def _load_snapshot() -> dict:
+    """Fresh copy of the saved genuineness_data.json (or an empty skeleton)."""
+    data = _load_json(GENUINENESS_DATA)
+    if data is None:
+        data = {
             "entries": [],
             "style_samples": [],
             "divergence_tests": [],
             "predictions": [],
         }
-    with open(GENUINENESS_DATA) as f:
-        return json.load(f)
+    # Fresh top-level dict and lists so the cached parses are never mutated
+    data = dict(data)
+    data["entries"] = list(data.get("entries", []))
+    data["style_samples"] = list(data.get("style_samples", []))
+    return data
+
+def _compacting_path(log_path: Path) -> Path:
+    """Where compact_genuineness_data moves a log while folding it in."""
+    return log_path.with_name(log_path.name + ".compacting")
+
+def load_genuineness_data() -> dict:
+    """
+    Load accumulated genuineness tracking data: the saved snapshot plus any
+    entries/style samples appended by track_entry since it was written.
+    """
+    data = _load_snapshot()
+    for key, log_path in (("entries", GENUINENESS_ENTRIES_LOG),
+                          ("style_samples", GENUINENESS_STYLE_LOG)):
+        data[key] += _load_jsonl(_compacting_path(log_path))
+        data[key] += _load_jsonl(log_path)
+    return data
 
 def save_genuineness_data(data: dict):
-    """Save genuineness tracking data (atomic write)."""
+    """
+    Save genuineness tracking data (atomic write). This writes the snapshot
+    only and leaves the JSONL logs alone, so save_genuineness_data(
+    load_genuineness_data()) would count the logged records twice on the
+    next load; use compact_genuineness_data to fold the logs in.
+    """
     from safe_write import atomic_write_json
     atomic_write_json(GENUINENESS_DATA, data)
 
+def compact_genuineness_data():
+    """
+    Fold the JSONL logs into genuineness_data.json. Each log is renamed aside
+    before it is read, so anything track_entry appends meanwhile lands in a
+    fresh log rather than being lost. An aside file left by an interrupted
+    compaction is merged by the next one.
+    """
+    logs = (("entries", GENUINENESS_ENTRIES_LOG), ("style_samples", GENUINENESS_STYLE_LOG))
+    for _, log_path in logs:
+        aside = _compacting_path(log_path)
+        if not aside.exists():
+            try:
+                os.replace(log_path, aside)
+            except FileNotFoundError:
+                pass
+    
+    data = _load_snapshot()
+    for key, log_path in logs:
+        data[key] += _load_jsonl(_compacting_path(log_path))
+    save_genuineness_data(data)
+    
+    for _, log_path in logs:
+        try:
+            os.unlink(_compacting_path(log_path))
+        except FileNotFoundError:
+            pass
+
+def _logs_need_compaction() -> bool:
+    for log_path in (GENUINENESS_ENTRIES_LOG, GENUINENESS_STYLE_LOG):
+        try:
+            if os.stat(log_path).st_size >= GENUINENESS_COMPACT_BYTES:
+                return True
+        except FileNotFoundError:
+            continue
+    return False
+
 def load_moods() -> dict:
     """Load mood definitions."""
-    if not MOODS_FILE.exists():
-        return {}
-    with open(MOODS_FILE) as f:
-        return json.load(f)
+    return _load_json(MOODS_FILE, {})
 
 def get_mood_names() -> List[str]:
     """Get list of all mood names."""
@@ -108,32 +232,48 @@ def get_mood_names() -> List[str]:
 # 1. Action Distribution Analysis
 # ---------------------------------------------------------------------------
 
-def compute_action_distribution(entries: List[dict]) -> Dict[str, Dict[str, float]]:
+def compute_action_distribution(
+        entries: List[dict]) -> Tuple[Dict[str, Dict[str, float]], Dict[str, int]]:
     """
     Compute what % of actions in each mood fall into each category.
-    Returns: {mood: {category: percentage, ...}, ...}
+    Returns: ({mood: {category: percentage, ...}, ...}, {mood: action_count, ...})
     """
-    mood_actions = defaultdict(list)
-    
+    return _distributions_from_counts(_scan_history(entries))
+
+
+def _scan_history(entries: List[dict]) -> Dict[str, Counter]:
+    """Count each mood's (lowercased) action categories in one pass."""
+    mood_counts = defaultdict(Counter)
     for entry in entries:
         mood = entry.get("mood", "unknown").lower()
-        thought_id = entry.get("thought_id", "unknown")
-        category = categorize_thought(thought_id)
-        mood_actions[mood].append(category)
-    
+        mood_counts[mood][categorize_thought(entry.get("thought_id", ""))] += 1
+    return mood_counts
+
+
+def _distributions_from_counts(
+        mood_counts: Dict[str, Counter]) -> Tuple[Dict[str, Dict[str, float]], Dict[str, int]]:
     distributions = {}
-    for mood, actions in mood_actions.items():
-        total = len(actions)
+    totals = {}
+    for mood, counter in mood_counts.items():
+        total = sum(counter.values())
         if total == 0:
             continue
-        counter = Counter(actions)
         distributions[mood] = {
             cat: round(count / total * 100, 1)
             for cat, count in counter.items()
         }
-        distributions[mood]["_total"] = total
+        totals[mood] = total
     
-    return distributions
+    return distributions, totals
+
+
+def _with_totals(distributions: Dict[str, Dict[str, float]],
+                 totals: Dict[str, int]) -> Dict[str, dict]:
+    """Distributions with each mood's action count as "_total" (JSON output shape)."""
+    return {mood: {**dist, "_total": totals[mood]} for mood, dist in distributions.items()}
+
+
+_INV_LN2 = 1 / math.log(2)
 
 
 def action_distribution_score(distributions: Dict[str, Dict[str, float]]) -> Tuple[float, str]:
@@ -150,35 +290,39 @@ def action_distribution_score(distributions: Dict[str, Dict[str, float]]) -> Tup
     # Compute Jensen-Shannon divergence between all mood pairs
     all_categories = set()
     for dist in distributions.values():
-        all_categories.update(k for k in dist if k != "_total")
+        all_categories.update(dist)
     
     moods = list(distributions.keys())
     divergences = []
     
+    # Build and normalize each mood's probability vector once, not once per pair
+    categories = tuple(all_categories)
+    vectors = []
+    for mood in moods:
+        dist = distributions[mood]
+        p = [dist.get(cat, 0) / 100 for cat in categories]
+        sp = sum(p)
+        if sp > 0:
+            p = [x / sp for x in p]
+        vectors.append(p)
+    # Σ p·ln(p) per mood, reused by every pair that mood takes part in
+    p_log_p = [sum(x * math.log(x) for x in p if x > 0) for p in vectors]
+    
     for i in range(len(moods)):
+        p = vectors[i]
         for j in range(i + 1, len(moods)):
-            d1 = distributions[moods[i]]
-            d2 = distributions[moods[j]]
-            
-            # Build probability vectors
-            p = [d1.get(cat, 0) / 100 for cat in all_categories]
-            q = [d2.get(cat, 0) / 100 for cat in all_categories]
+            q = vectors[j]
             
-            # Normalize
-            sp, sq = sum(p), sum(q)
-            if sp > 0:
-                p = [x / sp for x in p]
-            if sq > 0:
-                q = [x / sq for x in q]
-            
-            # Jensen-Shannon divergence
-            m = [(pi + qi) / 2 for pi, qi in zip(p, q)]
-            jsd = 0
-            for pi, qi, mi in zip(p, q, m):
-                if pi > 0 and mi > 0:
-                    jsd += 0.5 * pi * math.log2(pi / mi)
-                if qi > 0 and mi > 0:
-                    jsd += 0.5 * qi * math.log2(qi / mi)
+            # Jensen-Shannon divergence as H(m) - (H(p) + H(q)) / 2; only the
+            # midpoint entropy needs fresh logarithms per pair. Sums are in
+            # nats and converted to bits once at the end
+            m_log_m = 0.0
+            for pi, qi in zip(p, q):
+                mi = (pi + qi) / 2
+                if mi > 0:
+                    m_log_m += mi * math.log(mi)
+            # Clamp float noise for identical distributions
+            jsd = max(0.0, (0.5 * (p_log_p[i] + p_log_p[j]) - m_log_m) * _INV_LN2)
             
             divergences.append((moods[i], moods[j], jsd))
     
@@ -210,22 +354,31 @@ def action_distribution_score(distributions: Dict[str, Dict[str, float]]) -> Tup
 # 2. Output Style Analysis
 # ---------------------------------------------------------------------------
 
+_SENTENCE_ENDS = str.maketrans("!?", "..")
+# Anything above U+1F600 counts as an emoji; scanned by the regex engine
+_EMOJI_RE = re.compile("[\U0001F601-\U0010FFFF]")
+
+
 def analyze_text_style(text: str) -> dict:
     """Compute style metrics for a piece of text."""
     if not text:
         return {}
     
     words = text.split()
-    sentences = [s.strip() for s in text.replace("!", ".").replace("?", ".").split(".") if s.strip()]
+    word_count = max(len(words), 1)
+    # One translated copy instead of two replace() copies; count non-blank pieces
+    sentence_count = max(sum(
+        1 for s in text.translate(_SENTENCE_ENDS).split(".") if s and not s.isspace()
+    ), 1)
     
     return {
         "word_count": len(words),
-        "avg_sentence_length": round(len(words) / max(len(sentences), 1), 1),
-        "question_frequency": round(text.count("?") / max(len(sentences), 1) * 100, 1),
-        "exclamation_frequency": round(text.count("!") / max(len(sentences), 1) * 100, 1),
-        "emoji_count": sum(1 for c in text if ord(c) > 0x1F600),
-        "avg_word_length": round(sum(len(w) for w in words) / max(len(words), 1), 1),
-        "unique_word_ratio": round(len(set(w.lower() for w in words)) / max(len(words), 1), 2),
+        "avg_sentence_length": round(len(words) / sentence_count, 1),
+        "question_frequency": round(text.count("?") / sentence_count * 100, 1),
+        "exclamation_frequency": round(text.count("!") / sentence_count * 100, 1),
+        "emoji_count": 0 if text.isascii() else len(_EMOJI_RE.findall(text)),
+        "avg_word_length": round(sum(map(len, words)) / word_count, 1),
+        "unique_word_ratio": round(len(set(text.lower().split())) / word_count, 2),
     }
 
 
@@ -235,40 +388,47 @@ def compute_style_by_mood(data: dict) -> Dict[str, dict]:
     if not samples:
         return {}
     
-    mood_styles = defaultdict(list)
+    # Running per-mood metric totals (metric set taken from each mood's first
+    # sample) instead of collecting every metrics dict and re-walking it
+    totals = {}
+    counts = Counter()
     for sample in samples:
-        mood = sample.get("mood", "unknown").lower()
         metrics = sample.get("metrics", {})
-        if metrics:
-            mood_styles[mood].append(metrics)
+        if not metrics:
+            continue
+        mood = sample.get("mood", "unknown").lower()
+        mood_totals = totals.get(mood)
+        if mood_totals is None:
+            totals[mood] = dict(metrics)
+        else:
+            for key in mood_totals:
+                mood_totals[key] += metrics.get(key, 0)
+        counts[mood] += 1
     
     aggregated = {}
-    for mood, metrics_list in mood_styles.items():
-        if not metrics_list:
-            continue
-        agg = {}
-        for key in metrics_list[0]:
-            values = [m.get(key, 0) for m in metrics_list]
-            agg[key] = round(sum(values) / len(values), 2)
-        agg["_samples"] = len(metrics_list)
+    for mood, mood_totals in totals.items():
+        n = counts[mood]
+        agg = {key: round(total / n, 2) for key, total in mood_totals.items()}
+        agg["_samples"] = n
         aggregated[mood] = agg
     
     return aggregated
 
 
+# Key metrics compared across moods
+_STYLE_METRICS = ("avg_sentence_length", "question_frequency", "emoji_count",
+                  "avg_word_length", "unique_word_ratio")
+
+
 def style_divergence_score(styles: Dict[str, dict]) -> Tuple[float, str]:
     """Score how different output styles are across moods."""
     if len(styles) < 2:
         return 0.0, "Not enough style data (need text samples from at least 2 moods)"
     
-    # Compare key metrics across moods
-    metrics_to_compare = ["avg_sentence_length", "question_frequency", "emoji_count", 
-                          "avg_word_length", "unique_word_ratio"]
-    
     total_variance = 0
     metric_details = []
     
-    for metric in metrics_to_compare:
+    for metric in _STYLE_METRICS:
         values = {mood: s.get(metric, 0) for mood, s in styles.items()}
         if not values:
             continue
@@ -286,7 +446,7 @@ def style_divergence_score(styles: Dict[str, dict]) -> Tuple[float, str]:
         )
     
     # Normalize: CV of 0.3+ per metric is meaningful difference
-    score = min(100, (total_variance / max(len(metrics_to_compare), 1)) * 200)
+    score = min(100, (total_variance / len(_STYLE_METRICS)) * 200)
     
     explanation = "Style variation by metric (Coefficient of Variation):\n" + "\n".join(metric_details)
     
@@ -306,34 +466,40 @@ def compute_calibration(entries: List[dict]) -> Tuple[float, str]:
     if len(entries) < 5:
         return 0.0, f"Not enough data ({len(entries)} entries, need 5+)"
     
-    energy_lengths = {"high": [], "neutral": [], "low": []}
-    vibe_lengths = {"positive": [], "neutral": [], "negative": []}
+    # Running [word total, count] per level, plus the distinct raw self-reports
+    energy_lengths = {"high": [0, 0], "neutral": [0, 0], "low": [0, 0]}
+    energies_seen = set()
+    vibes_seen = set()
     
     for entry in entries:
-        summary = entry.get("summary", "")
+        # Tracked entries already record summary_length; history entries don't
+        word_count = entry.get("summary_length")
+        if word_count is None:
+            word_count = len(entry.get("summary", "").split())
         energy = entry.get("energy", "neutral")
-        vibe = entry.get("vibe", "neutral")
-        word_count = len(summary.split())
         
         if energy in energy_lengths:
-            energy_lengths[energy].append(word_count)
-        if vibe in vibe_lengths:
-            vibe_lengths[vibe].append(word_count)
+            totals = energy_lengths[energy]
+            totals[0] += word_count
+            totals[1] += 1
+        energies_seen.add(entry.get("energy", ""))
+        vibes_seen.add(entry.get("vibe", ""))
     
     details = []
     calibration_signals = 0
     total_signals = 0
     
     # Check: high energy → more words?
-    for level, lengths in energy_lengths.items():
-        if lengths:
-            avg = sum(lengths) / len(lengths)
-            details.append(f"  Energy={level}: avg summary length {avg:.0f} words (n={len(lengths)})")
+    for level, (total_words, n) in energy_lengths.items():
+        if n:
+            details.append(f"  Energy={level}: avg summary length {total_words / n:.0f} words (n={n})")
     
-    high_avg = sum(energy_lengths["high"]) / max(len(energy_lengths["high"]), 1)
-    low_avg = sum(energy_lengths["low"]) / max(len(energy_lengths["low"]), 1) if energy_lengths["low"] else high_avg
+    high_words, high_n = energy_lengths["high"]
+    low_words, low_n = energy_lengths["low"]
+    high_avg = high_words / max(high_n, 1)
+    low_avg = low_words / low_n if low_n else high_avg
     
-    if energy_lengths["high"] and energy_lengths["low"]:
+    if high_n and low_n:
         total_signals += 1
         if high_avg > low_avg:
             calibration_signals += 1
@@ -341,28 +507,22 @@ def compute_calibration(entries: List[dict]) -> Tuple[float, str]:
         else:
             details.append("  ✗ High energy does NOT produce longer summaries — possible miscalibration")
     
-    # Check: positive vibe → more words?
-    pos_avg = sum(vibe_lengths["positive"]) / max(len(vibe_lengths["positive"]), 1)
-    neg_avg = sum(vibe_lengths["negative"]) / max(len(vibe_lengths["negative"]), 1) if vibe_lengths["negative"] else 0
-    
     # Check all self-reports aren't identical
-    all_energy = [e.get("energy", "") for e in entries]
-    all_vibe = [e.get("vibe", "") for e in entries]
-    energy_diversity = len(set(all_energy))
-    vibe_diversity = len(set(all_vibe))
+    energy_diversity = len(energies_seen)
+    vibe_diversity = len(vibes_seen)
     
     total_signals += 2
     if energy_diversity >= 2:
         calibration_signals += 1
         details.append(f"  ✓ Energy diversity: {energy_diversity} different levels reported")
     else:
-        details.append(f"  ✗ Energy always '{all_energy[0]}' — self-report may be autopilot")
+        details.append(f"  ✗ Energy always '{entries[0].get('energy', '')}' — self-report may be autopilot")
     
     if vibe_diversity >= 2:
         calibration_signals += 1
         details.append(f"  ✓ Vibe diversity: {vibe_diversity} different levels reported")
     else:
-        details.append(f"  ✗ Vibe always '{all_vibe[0]}' — self-report may be autopilot")
+        details.append(f"  ✗ Vibe always '{entries[0].get('vibe', '')}' — self-report may be autopilot")
     
     score = (calibration_signals / max(total_signals, 1)) * 100
     explanation = "Self-report calibration:\n" + "\n".join(details)
@@ -374,34 +534,32 @@ def compute_calibration(entries: List[dict]) -> Tuple[float, str]:
 # 4. Surprise Index
 # ---------------------------------------------------------------------------
 
-def compute_surprise_index(data: dict) -> Tuple[float, str]:
+def compute_surprise_index(data: dict, history: Optional[List[dict]] = None,
+                           mood_counts: Optional[Dict[str, Counter]] = None) -> Tuple[float, str]:
     """
     How often does behavior diverge from the most likely action for that mood?
     High surprise = genuine emergence. Low surprise = deterministic.
+    Pass history (and its _scan_history result) if the caller already has them.
     """
-    entries = load_history()
+    entries = load_history() if history is None else history
     if len(entries) < 10:
         return 0.0, f"Not enough history ({len(entries)} entries, need 10+)"
     
-    # Build mood → most common category
-    mood_categories = defaultdict(list)
-    for entry in entries:
-        mood = entry.get("mood", "unknown").lower()
-        category = categorize_thought(entry.get("thought_id", ""))
-        mood_categories[mood].append(category)
+    # Build mood → category counts of its actions
+    if mood_counts is None:
+        mood_counts = _scan_history(entries)
     
     # For each entry, was it the most common action for that mood?
     surprises = 0
     total = 0
     
-    for mood, categories in mood_categories.items():
-        if len(categories) < 3:
+    for counts in mood_counts.values():
+        n = sum(counts.values())
+        if n < 3:
             continue
-        most_common = Counter(categories).most_common(1)[0][0]
-        for cat in categories:
-            total += 1
-            if cat != most_common:
-                surprises += 1
+        # Everything outside the most common category is a surprise
+        total += n
+        surprises += n - max(counts.values())
     
     if total == 0:
         return 0.0, "Not enough data to compute surprise"
@@ -460,6 +618,15 @@ ENGAGEMENT_BAIT_PHRASES = [
     "who else",
 ]
 
+# All performative phrases mapped to their category, in scan order
+_PERFORMATIVE_PHRASES = {
+    phrase: category
+    for phrases, category in ((VIRTUE_SIGNAL_PHRASES, "virtue_signal"),
+                              (EMPTY_PROMISE_PHRASES, "empty_promise"),
+                              (ENGAGEMENT_BAIT_PHRASES, "engagement_bait"))
+    for phrase in phrases
+}
+
 # Mood ↔ thought coherence map: which thought categories feel genuine per mood
 MOOD_THOUGHT_COHERENCE = {
     'chaotic':       {'explore': 0.9, 'reflect': 0.8, 'build': 0.5, 'social': 0.4, 'pitch': 0.7},
@@ -481,17 +648,8 @@ def _detect_performative_phrases(text: str) -> List[Tuple[str, str]]:
     Returns list of (phrase_found, category).
     """
     text_lower = text.lower()
-    hits = []
-    for phrase in VIRTUE_SIGNAL_PHRASES:
-        if phrase in text_lower:
-            hits.append((phrase, "virtue_signal"))
-    for phrase in EMPTY_PROMISE_PHRASES:
-        if phrase in text_lower:
-            hits.append((phrase, "empty_promise"))
-    for phrase in ENGAGEMENT_BAIT_PHRASES:
-        if phrase in text_lower:
-            hits.append((phrase, "engagement_bait"))
-    return hits
+    return [(phrase, category) for phrase, category in _PERFORMATIVE_PHRASES.items()
+            if phrase in text_lower]
 
 
 def _check_repetition(thought_id: str, lookback: int = 10) -> Tuple[float, str]:
@@ -499,13 +657,13 @@ def _check_repetition(thought_id: str, lookback: int = 10) -> Tuple[float, str]:
     Check how recently this thought was picked.
     Returns (penalty 0-0.4, reason).
     """
+    # history.json is capped at 500 entries by log_result.sh and its parse is
+    # cached per mtime, so re-rolls within one run only rescan the tail
     history = load_history()
     if not history:
         return 0.0, ""
 
-    recent = history[-lookback:]
-    recent_ids = [e.get("thought_id", "") for e in recent]
-    count = recent_ids.count(thought_id)
+    count = sum(1 for e in history[-lookback:] if e.get("thought_id", "") == thought_id)
 
     if count == 0:
         return 0.0, ""
@@ -517,19 +675,22 @@ def _check_repetition(thought_id: str, lookback: int = 10) -> Tuple[float, str]:
         return 0.4, f"'{thought_id}' picked {count}x in last {lookback} — engagement rut"
 
 
+@lru_cache(maxsize=32)
+def _match_coherence_mood(mood_name: str) -> Optional[str]:
+    """First MOOD_THOUGHT_COHERENCE key contained in the mood name (mood names are few)."""
+    for mood_key in MOOD_THOUGHT_COHERENCE:
+        if mood_key in mood_name:
+            return mood_key
+    return None
+
+
 def _mood_coherence_score(thought_id: str, mood_name: str) -> Tuple[float, str]:
     """
     Score how coherent this thought category is with the current mood.
     Returns (score 0-1, reason).
     """
     category = categorize_thought(thought_id)
-
-    # Find matching mood key
-    matched_mood = None
-    for mood_key in MOOD_THOUGHT_COHERENCE:
-        if mood_key in mood_name:
-            matched_mood = mood_key
-            break
+    matched_mood = _match_coherence_mood(mood_name)
 
     if not matched_mood:
         return 0.5, f"No coherence data for mood '{mood_name}'"
@@ -545,19 +706,61 @@ def _mood_coherence_score(thought_id: str, mood_name: str) -> Tuple[float, str]:
     return coherence, reason
 
 
-def _log_filter_result(thought_id: str, score: float, reasons: List[str],
-                       mood_name: str, filtered: bool):
-    """Append a line to the genuineness filter log."""
+# Filter log lines are buffered and written in batches (and at exit)
+_FILTER_LOG_BUFFER: List[str] = []
+_FILTER_LOG_FLUSH_AT = 64
+
+
+def _flush_filter_log():
+    """Write any buffered filter log lines with a single open/write."""
+    if not _FILTER_LOG_BUFFER:
+        return
     try:
         GENUINENESS_FILTER_LOG.parent.mkdir(parents=True, exist_ok=True)
-        ts = datetime.now().isoformat()
-        status = "FILTERED" if filtered else "PASSED"
-        reason_str = "; ".join(reasons) if reasons else "no flags"
-        line = f"{ts} | {status} | {thought_id} | score={score:.2f} | mood={mood_name} | {reason_str}\n"
         with open(GENUINENESS_FILTER_LOG, "a") as f:
-            f.write(line)
+            f.writelines(_FILTER_LOG_BUFFER)
     except Exception:
         pass  # Never crash the pipeline over logging
+    _FILTER_LOG_BUFFER.clear()
+
+
+atexit.register(_flush_filter_log)
+
+
+def _log_filter_result(thought_id: str, score: float, reasons: List[str],
+                       mood_name: str, filtered: bool):
+    """Queue a line for the genuineness filter log."""
+    ts = datetime.now().isoformat()
+    status = "FILTERED" if filtered else "PASSED"
+    reason_str = "; ".join(reasons) if reasons else "no flags"
+    _FILTER_LOG_BUFFER.append(
+        f"{ts} | {status} | {thought_id} | score={score:.2f} | mood={mood_name} | {reason_str}\n"
+    )
+    if len(_FILTER_LOG_BUFFER) >= _FILTER_LOG_FLUSH_AT:
+        _flush_filter_log()
+
+
+# Legacy keyword alignment: words that clash with / suit each mood
+PERFORMATIVE_KEYWORDS = {
+    'chaotic': ['organize', 'systematic', 'methodical'],
+    'cozy': ['aggressive', 'disruptive'],
+    'philosophical': ['quick', 'fast', 'minimal'],
+    'hyperfocus': ['casual', 'random', 'distract'],
+    'social': ['alone', 'isolate'],
+    'restless': ['slow', 'patient', 'wait'],
+}
+GENUINE_KEYWORDS = {
+    'chaotic': ['creative', 'experiment', 'new'],
+    'cozy': ['comfortable', 'gentle', 'warm'],
+    'philosophical': ['deep', 'meaning', 'reflect'],
+    'hyperfocus': ['build', 'focus', 'concentrate'],
+    'social': ['share', 'connect', 'interact'],
+    'restless': ['energy', 'action', 'move'],
+}
+
+_WORD_RE = re.compile(r"\w+")
+
+GENUINENESS_FILTER_THRESHOLD = 0.3
 
 
 def check_genuineness(thought_prompt: str, mood: dict,
@@ -604,36 +807,22 @@ def check_genuineness(thought_prompt: str, mood: dict,
             reasons.append(coh_reason)
 
     # --- 4. Keyword alignment (legacy, lighter weight) ---
-    prompt_lower = thought_prompt.lower()
-    performative_kw = {
-        'chaotic': ['organize', 'systematic', 'methodical'],
-        'cozy': ['aggressive', 'disruptive'],
-        'philosophical': ['quick', 'fast', 'minimal'],
-        'hyperfocus': ['casual', 'random', 'distract'],
-        'social': ['alone', 'isolate'],
-        'restless': ['slow', 'patient', 'wait'],
-    }
-    genuine_kw = {
-        'chaotic': ['creative', 'experiment', 'new'],
-        'cozy': ['comfortable', 'gentle', 'warm'],
-        'philosophical': ['deep', 'meaning', 'reflect'],
-        'hyperfocus': ['build', 'focus', 'concentrate'],
-        'social': ['share', 'connect', 'interact'],
-        'restless': ['energy', 'action', 'move'],
-    }
-    for mood_key in performative_kw:
+    # Whole-word matches against the prompt's word set ('new' no longer
+    # matches 'news'); keyword lists are walked in order to keep reasons stable
+    prompt_words = set(_WORD_RE.findall(thought_prompt.lower()))
+    for mood_key in PERFORMATIVE_KEYWORDS:
         if mood_key in mood_name:
-            for word in performative_kw[mood_key]:
-                if word in prompt_lower:
+            for word in PERFORMATIVE_KEYWORDS[mood_key]:
+                if word in prompt_words:
                     score -= 0.1
                     reasons.append(f"'{word}' conflicts with {mood_name}")
-            for word in genuine_kw.get(mood_key, []):
-                if word in prompt_lower:
+            for word in GENUINE_KEYWORDS.get(mood_key, ()):
+                if word in prompt_words:
                     score += 0.05
                     reasons.append(f"'{word}' aligns with {mood_name}")
 
     score = max(0.0, min(1.0, score))
-    filtered = score < 0.3
+    filtered = score < GENUINENESS_FILTER_THRESHOLD
 
     # Log every check
     _log_filter_result(thought_id or "unknown", score, reasons, mood_name, filtered)
@@ -653,9 +842,9 @@ def track_entry(mood: str, thought_id: str, summary: str, energy: str, vibe: str
                 output_text: str = ""):
     """
     Record a genuineness data point. Called by log_result.sh after each action.
+    Appends to the JSONL logs instead of rewriting genuineness_data.json,
+    compacting them into it once they pass GENUINENESS_COMPACT_BYTES.
     """
-    data = load_genuineness_data()
-    
     entry = {
         "timestamp": datetime.now().isoformat(),
         "mood": mood,
@@ -665,7 +854,7 @@ def track_entry(mood: str, thought_id: str, summary: str, energy: str, vibe: str
         "vibe": vibe,
         "summary_length": len(summary.split()),
     }
-    data["entries"].append(entry)
+    _append_jsonl(GENUINENESS_ENTRIES_LOG, entry)
     
     # Track style if output text provided
     if output_text:
@@ -674,9 +863,11 @@ def track_entry(mood: str, thought_id: str, summary: str, energy: str, vibe: str
             "mood": mood,
             "metrics": analyze_text_style(output_text),
         }
-        data["style_samples"].append(style_sample)
+        _append_jsonl(GENUINENESS_STYLE_LOG, style_sample)
+    
+    if _logs_need_compaction():
+        compact_genuineness_data()
     
-    save_genuineness_data(data)
     return entry
 
 
@@ -689,8 +880,9 @@ def compute_genuineness_score() -> dict:
     history = load_history()
     gen_data = load_genuineness_data()
     
-    # 1. Action distribution
-    distributions = compute_action_distribution(history)
+    # 1. Action distribution (the per-mood scan is shared with the surprise index)
+    mood_counts = _scan_history(history)
+    distributions, totals = _distributions_from_counts(mood_counts)
     action_score, action_detail = action_distribution_score(distributions)
     
     # 2. Style analysis
@@ -701,7 +893,7 @@ def compute_genuineness_score() -> dict:
     calibration_score, calibration_detail = compute_calibration(history)
     
     # 4. Surprise index
-    surprise_score, surprise_detail = compute_surprise_index(gen_data)
+    surprise_score, surprise_detail = compute_surprise_index(gen_data, history, mood_counts)
     
     # Weighted average (action distribution matters most)
     weights = {
@@ -737,7 +929,7 @@ def compute_genuineness_score() -> dict:
                 "score": action_score,
                 "weight": weights["action_distribution"],
                 "detail": action_detail,
-                "data": distributions,
+                "data": _with_totals(distributions, totals),
             },
             "output_style": {
                 "score": style_score,
@@ -759,6 +951,33 @@ def compute_genuineness_score() -> dict:
     }
 
 
+# Score bands (lower bounds) and their interpretations, lowest first
+_SCORE_BANDS = (20, 50, 80)
+_INTERPRETATIONS = (
+    (
+        "🔴 NEGLIGIBLE GENUINENESS — No measurable difference in behavior across "
+        "moods. The mood system is almost certainly cosmetic — just changing labels "
+        "on identical behavior. Consider redesigning how moods influence action "
+        "selection, or accept that the current system is theatrical."
+    ),
+    (
+        "🟠 LOW GENUINENESS — Minimal behavioral differences across moods. The "
+        "agent does roughly the same things regardless of mood state. The mood "
+        "system may be decorative. Investigate which dimensions score lowest."
+    ),
+    (
+        "🟡 MODERATE GENUINENESS — Some behavioral differences across moods are "
+        "detectable, but they're subtle. The mood system is partially influencing "
+        "behavior. Consider whether the differences are meaningful or cosmetic."
+    ),
+    (
+        "🟢 HIGH GENUINENESS — Moods are producing measurably different behavior "
+        "patterns, output styles, and surprise levels. The mood system appears to "
+        "be genuinely influencing agent behavior, not just labeling it."
+    ),
+)
+
+
 def interpret_score(score: float, data_status: str) -> str:
     """Human-readable interpretation of genuineness score."""
     if data_status == "insufficient":
@@ -768,43 +987,26 @@ def interpret_score(score: float, data_status: str) -> str:
             "and check back in a few days."
         )
     
-    if score >= 80:
-        return (
-            "🟢 HIGH GENUINENESS — Moods are producing measurably different behavior "
-            "patterns, output styles, and surprise levels. The mood system appears to "
-            "be genuinely influencing agent behavior, not just labeling it."
-        )
-    elif score >= 50:
-        return (
-            "🟡 MODERATE GENUINENESS — Some behavioral differences across moods are "
-            "detectable, but they're subtle. The mood system is partially influencing "
-            "behavior. Consider whether the differences are meaningful or cosmetic."
-        )
-    elif score >= 20:
-        return (
-            "🟠 LOW GENUINENESS — Minimal behavioral differences across moods. The "
-            "agent does roughly the same things regardless of mood state. The mood "
-            "system may be decorative. Investigate which dimensions score lowest."
-        )
-    else:
-        return (
-            "🔴 NEGLIGIBLE GENUINENESS — No measurable difference in behavior across "
-            "moods. The mood system is almost certainly cosmetic — just changing labels "
-            "on identical behavior. Consider redesigning how moods influence action "
-            "selection, or accept that the current system is theatrical."
-        )
+    return _INTERPRETATIONS[bisect.bisect_right(_SCORE_BANDS, score)]
 
 
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
 
-def print_report(as_json: bool = False):
+def _dumps_json(obj, compact: bool = False) -> str:
+    """Indented JSON for humans, or minimal separators with --compact."""
+    if compact:
+        return json.dumps(obj, separators=(",", ":"))
+    return json.dumps(obj, indent=2)
+
+
+def print_report(as_json: bool = False, compact: bool = False):
     """Print full genuineness report."""
     result = compute_genuineness_score()
     
     if as_json:
-        print(json.dumps(result, indent=2))
+        print(_dumps_json(result, compact))
         return
     
     print("=" * 60)
@@ -825,13 +1027,13 @@ def print_report(as_json: bool = False):
         print()
 
 
-def print_distribution(as_json: bool = False):
+def print_distribution(as_json: bool = False, compact: bool = False):
     """Print action distribution per mood."""
     history = load_history()
-    distributions = compute_action_distribution(history)
+    distributions, totals = compute_action_distribution(history)
     
     if as_json:
-        print(json.dumps(distributions, indent=2))
+        print(_dumps_json(_with_totals(distributions, totals), compact))
         return
     
     if not distributions:
@@ -841,8 +1043,7 @@ def print_distribution(as_json: bool = False):
     print("Action Distribution by Mood:")
     print()
     for mood, dist in sorted(distributions.items()):
-        total = dist.pop("_total", 0)
-        print(f"  {mood} (n={total}):")
+        print(f"  {mood} (n={totals[mood]}):")
         for cat, pct in sorted(dist.items(), key=lambda x: -x[1]):
             bar = "█" * int(pct / 5)
             print(f"    {cat:12s} {pct:5.1f}% {bar}")
@@ -852,12 +1053,13 @@ def print_distribution(as_json: bool = False):
 def main():
     args = sys.argv[1:]
     as_json = "--json" in args
-    args = [a for a in args if a != "--json"]
+    compact = "--compact" in args
+    args = [a for a in args if a not in ("--json", "--compact")]
     
     command = args[0] if args else "report"
     
     if command == "report":
-        print_report(as_json)
+        print_report(as_json, compact)
     elif command == "score":
         result = compute_genuineness_score()
         if as_json:
@@ -866,12 +1068,12 @@ def main():
             print(f"Genuineness Score: {result['overall_score']}/100 ({result['data_status']})")
             print(result["interpretation"])
     elif command == "distribution":
-        print_distribution(as_json)
+        print_distribution(as_json, compact)
     elif command == "style":
         gen_data = load_genuineness_data()
         styles = compute_style_by_mood(gen_data)
         if as_json:
-            print(json.dumps(styles, indent=2))
+            print(_dumps_json(styles, compact))
         else:
             score, detail = style_divergence_score(styles)
             print(f"Style Divergence Score: {score}/100")
@@ -889,10 +1091,12 @@ def main():
         if not GENUINENESS_FILTER_LOG.exists():
             print("No filter log yet.")
             sys.exit(0)
-        lines = GENUINENESS_FILTER_LOG.read_text().strip().split("\n")
         n = int(args[1]) if len(args) > 1 and args[1].isdigit() else 20
-        for line in lines[-n:]:
-            print(line)
+        # Stream the file keeping only the tail (0 still means "everything")
+        with open(GENUINENESS_FILTER_LOG) as f:
+            lines = deque(f, maxlen=n or None)
+        for line in lines:
+            print(line.rstrip("\n"))
     elif command == "check":
         # Manual check: genuineness.py check <thought_id> <prompt_text>
         if len(args) < 3:
@@ -915,6 +1119,9 @@ def main():
         else:
             status = "🚫 FILTERED" if score < 0.3 else "✅ PASSED"
             print(f"{status} | {thought_id} | score={score:.2f} | {reason}")
+    elif command == "compact-logs":
+        compact_genuineness_data()
+        print(f"Compacted tracking logs into {GENUINENESS_DATA.name}")
     elif command == "track":
         # track <mood> <thought_id> <summary> <energy> <vibe> [output_text]
         if len(args) < 6:
@@ -923,7 +1130,7 @@ def main():
         entry = track_entry(args[1], args[2], args[3], args[4], args[5],
                           args[6] if len(args) > 6 else "")
         if as_json:
-            print(json.dumps(entry, indent=2))
+            print(_dumps_json(entry, compact))
         else:
             print(f"Tracked: {entry['mood']}/{entry['category']} ({entry['energy']}/{entry['vibe']})")
     else:
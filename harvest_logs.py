@@ -10,7 +10,9 @@ Usage: python3 harvest_logs.py [--force] [--dry-run]
 """
 
 import json
+import mmap
 import os
+import re
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
@@ -21,6 +23,36 @@ HARVEST_STATE_FILE = SCRIPT_DIR / "harvest_state.json"
 SESSIONS_DIR = Path.home() / ".openclaw/agents/main/sessions"
 CRON_JOBS_FILE = Path.home() / ".openclaw/cron/jobs.json"
 
+# "[cron:<id> <name>]": id and (optional) name from one search
+_CRON_RE = re.compile(r'\[cron:([a-f0-9-]+)(?: ([^\]]+)\])?')
+_CRON_NAME_RE = re.compile(r'\[cron:[a-f0-9-]+ ([^\]]+)\]')
+# intrusive.sh prints the picked thought as a flat JSON object
+_THOUGHT_JSON_RE = re.compile(r'\{[^}]*"id"[^}]*\}')
+
+# Skill detection from tool calls
+SKILL_INDICATORS = {
+    "moltbook": ["moltbook", "moltbook-post"],
+    "github": ["gh ", "github"],
+    "network-recon": ["nmap", "arp-scan"],
+    "screenshot": ["chromium", "screenshot"],
+    "docker-basics": ["docker"],
+    "systemd-services": ["systemctl"],
+    "git-workflow": ["git "],
+    "webserver-debug": ["curl", "httpie"],
+    "intrusive-thoughts": ["intrusive.sh", "set_mood", "log_result", "select_mood"],
+}
+# Flattened (indicator, skill) pairs for the per-message scans
+_INDICATOR_SKILLS = tuple(
+    (ind, skill) for skill, indicators in SKILL_INDICATORS.items() for ind in indicators
+)
+
+def _add_skills(text, skills_used):
+    """Record skills whose indicators appear in (lowercased) text."""
+    for ind, skill in _INDICATOR_SKILLS:
+        # A skill already seen in this session needs no more substring scans
+        if skill not in skills_used and ind in text:
+            skills_used.add(skill)
+
 # Known intrusive-thoughts cron job IDs (loaded dynamically)
 def get_it_cron_ids():
     """Get cron job IDs that belong to intrusive-thoughts."""
@@ -61,6 +93,20 @@ def save_history(history):
     from safe_write import atomic_write_json
     atomic_write_json(HISTORY_FILE, history)
 
+def _has_cron_marker(session_path):
+    """
+    Cheap pre-check: only sessions whose log contains "[cron:" can be cron
+    triggered, so anything else can be skipped without JSON-parsing it.
+    """
+    try:
+        with open(session_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return False  # mmap refuses empty files
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return mm.find(b"[cron:") != -1
+    except (OSError, ValueError):
+        return True  # Let extract_session_data report the problem
+
 def extract_session_data(session_path):
     """Extract activity data from a session log file."""
     messages = []
@@ -77,25 +123,14 @@ def extract_session_data(session_path):
     assistant_texts = []
     model_used = None
     
-    # Skill detection from tool calls
-    skill_indicators = {
-        "moltbook": ["moltbook", "moltbook-post"],
-        "github": ["gh ", "github"],
-        "network-recon": ["nmap", "arp-scan"],
-        "screenshot": ["chromium", "screenshot"],
-        "docker-basics": ["docker"],
-        "systemd-services": ["systemctl"],
-        "git-workflow": ["git "],
-        "webserver-debug": ["curl", "httpie"],
-        "intrusive-thoughts": ["intrusive.sh", "set_mood", "log_result", "select_mood"],
-    }
-    
     try:
-        with open(session_path) as f:
+        # Session logs are UTF-8 JSON Lines; json.loads decodes bytes itself
+        # and ignores the trailing newline, so no per-line decode/strip copies
+        with open(session_path, "rb") as f:
             for line in f:
                 try:
-                    d = json.loads(line.strip())
-                except json.JSONDecodeError:
+                    d = json.loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
                     continue
                 
                 if d.get("type") == "message":
@@ -115,15 +150,17 @@ def extract_session_data(session_path):
                             for c in content:
                                 text = c.get("text", "")
                                 if "[cron:" in text:
-                                    # Extract cron job ID
-                                    import re
-                                    match = re.search(r'\[cron:([a-f0-9-]+)', text)
+                                    # Extract cron job ID and name
+                                    match = _CRON_RE.search(text)
                                     if match:
                                         cron_id = match.group(1)
-                                    # Extract cron name
-                                    name_match = re.search(r'\[cron:[a-f0-9-]+ ([^\]]+)\]', text)
-                                    if name_match:
-                                        cron_name = name_match.group(1)
+                                        if match.group(2) is not None:
+                                            cron_name = match.group(2)
+                                        else:
+                                            # First marker is unnamed; a later one may not be
+                                            name_match = _CRON_NAME_RE.search(text, match.end())
+                                            if name_match:
+                                                cron_name = name_match.group(1)
                     
                     elif role == "assistant":
                         content = msg.get("content", [])
@@ -138,20 +175,24 @@ def extract_session_data(session_path):
                                         tools_used.add(tool_name)
                                     # Check arguments for skill indicators
                                     args = json.dumps(c.get("arguments", {})).lower()
-                                    for skill, indicators in skill_indicators.items():
-                                        for ind in indicators:
-                                            if ind in args:
-                                                skills_used.add(skill)
+                                    _add_skills(args, skills_used)
                     
                     elif role == "toolResult":
                         content = msg.get("content", [])
                         if isinstance(content, list):
                             for c in content:
-                                text = c.get("text", "").lower()
-                                for skill, indicators in skill_indicators.items():
-                                    for ind in indicators:
-                                        if ind in text:
-                                            skills_used.add(skill)
+                                text = c.get("text", "")
+                                _add_skills(text.lower(), skills_used)
+                                # Extract thought_id from the intrusive.sh output:
+                                # JSON containing "id" and "prompt" (last one wins)
+                                if '"id"' in text and '"prompt"' in text:
+                                    json_match = _THOUGHT_JSON_RE.search(text)
+                                    if json_match:
+                                        try:
+                                            thought_data = json.loads(json_match.group())
+                                            thought_id = thought_data.get("id", thought_id)
+                                        except json.JSONDecodeError:
+                                            pass
                 
                 elif d.get("type") == "model_change":
                     model_used = d.get("modelId", model_used)
@@ -170,29 +211,6 @@ def extract_session_data(session_path):
     if not cron_id:
         return None  # Not a cron-triggered session
     
-    # Extract thought_id from the intrusive.sh output in tool results
-    # Look for JSON output containing "id" field
-    try:
-        with open(session_path) as f:
-            for line in f:
-                d = json.loads(line.strip())
-                if d.get("type") == "message" and d.get("message", {}).get("role") == "toolResult":
-                    content = d["message"].get("content", [])
-                    for c in content:
-                        text = c.get("text", "")
-                        if '"id"' in text and '"prompt"' in text:
-                            try:
-                                # Find JSON in the output
-                                import re
-                                json_match = re.search(r'\{[^}]*"id"[^}]*\}', text)
-                                if json_match:
-                                    thought_data = json.loads(json_match.group())
-                                    thought_id = thought_data.get("id", thought_id)
-                            except:
-                                pass
-    except:
-        pass
-    
     # Generate summary from last meaningful assistant text
     summary = ""
     for text in reversed(assistant_texts):
@@ -246,6 +264,9 @@ def harvest(force=False, dry_run=False):
     
     # Get existing session IDs to avoid duplicates
     existing_sessions = {e.get("session_id") for e in history if e.get("session_id")}
+    # The state keeps an ordered list (trimmed to the most recent 200 below);
+    # membership checks go through a set
+    harvested_sessions = set(state.get("harvested_sessions", []))
     
     # Scan session files
     if not SESSIONS_DIR.exists():
@@ -253,24 +274,32 @@ def harvest(force=False, dry_run=False):
         return
     
     new_entries = []
-    session_files = sorted(SESSIONS_DIR.glob("*.jsonl"), key=lambda p: p.stat().st_mtime)
+    # One stat per file (scandir entries cache it), reused for the age check
+    with os.scandir(SESSIONS_DIR) as it:
+        session_files = [
+            (entry.stat().st_mtime, Path(entry.path))
+            for entry in it if entry.name.endswith(".jsonl")
+        ]
+    session_files.sort(key=lambda f: f[0])
     
-    for session_path in session_files:
+    for file_mtime, session_path in session_files:
         session_id = session_path.stem
         
         # Skip already harvested
         if not force and session_id in existing_sessions:
             continue
-        if not force and session_id in state.get("harvested_sessions", []):
+        if not force and session_id in harvested_sessions:
             continue
         
         # Skip files older than last harvest (unless force)
         if not force and state["last_harvest_ms"] > 0:
-            file_mtime_ms = int(session_path.stat().st_mtime * 1000)
+            file_mtime_ms = int(file_mtime * 1000)
             if file_mtime_ms < state["last_harvest_ms"] - 60000:  # 1min buffer
                 continue
         
-        # Extract data
+        # Extract data (non-cron sessions never contain the marker)
+        if not _has_cron_marker(session_path):
+            continue
         data = extract_session_data(session_path)
         if data is None:
             continue
@@ -37,17 +37,19 @@ case "${1:-}" in
         ;;
     explain)
         if [[ -z "$2" ]]; then
-            echo "Usage: intrusive.sh explain <system>"
+            echo "Usage: intrusive.sh explain <system> [--brief]"
             echo "Available systems: moods, memory, trust, evolution, health, thoughts, proactive"
             exit 1
         fi
-        exec python3 "$SCRIPT_DIR/explain_system.py" "$2"
+        shift
+        exec python3 "$SCRIPT_DIR/explain_system.py" "$@"
         ;;
     introspect)
         exec python3 "$SCRIPT_DIR/introspect.py"
         ;;
     why)
-        exec python3 "$SCRIPT_DIR/decision_trace.py" "${2:-}"
+        shift
+        exec python3 "$SCRIPT_DIR/decision_trace.py" "$@"
         ;;
     export-state)
         python3 -c "
@@ -263,7 +265,7 @@ print(f'  Recent history: {len(import_data.get(\"recent_history\", []))} entries
         echo "Self-awareness commands:"
         echo "  intrusive.sh explain <system>    Explain how a subsystem works"
         echo "  intrusive.sh introspect          Full state dump as JSON"
-        echo "  intrusive.sh why [action-id]     Trace decision path for recent action"
+        echo "  intrusive.sh why [action-id] [--top N]  Trace decision path for recent action"
         echo ""
         echo "Context survival:"
         echo "  intrusive.sh export-state        Export agent state as JSON"
@@ -157,7 +157,20 @@ class TestDecisionTraceLoading:
             with patch('decision_trace.get_data_dir', return_value=Path(temp_dir)):
                 result = load_decisions_log()
                 assert result == []
-    
+
+    @pytest.mark.parametrize("content", ["", "  \n"])
+    def test_load_decisions_log_empty_file(self, content, capsys):
+        """Test that an empty or blank decisions.json is treated as no decisions."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            decisions_file = Path(temp_dir) / "log" / "decisions.json"
+            decisions_file.parent.mkdir(parents=True)
+            decisions_file.write_text(content)
+
+            with patch('decision_trace.get_data_dir', return_value=Path(temp_dir)):
+                result = load_decisions_log()
+                assert result == []
+                assert capsys.readouterr().err == ""
+
     def test_load_history_success(self, sample_history):
         """Test successful loading of history.json."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -318,6 +331,27 @@ class TestDecisionAnalysis:
         assert "High probability selection (weight 3.2)" in captured.out
         assert "strong advantages" in captured.out
 
+    def test_explain_decision_top_limits_candidates(self, sample_decisions, capsys):
+        """Test that top=N only lists the N highest-weighted candidates."""
+        decision = sample_decisions[0]
+        explain_decision(decision, top=2)
+
+        captured = capsys.readouterr()
+        assert "share-discovery: 1.5 → 2.5" in captured.out
+        assert "ask-opinion: 1.8 → 1.8" in captured.out
+        assert "random-thought: 2.0 → 1.0 (-1.0)" not in captured.out
+        assert "1 more candidates" in captured.out
+
+    def test_explain_decision_summary_only(self, sample_decisions, capsys):
+        """Test that summary_only skips the per-candidate sections."""
+        decision = sample_decisions[0]
+        explain_decision(decision, summary_only=True)
+
+        captured = capsys.readouterr()
+        assert "🎯 Selected Action:" in captured.out
+        assert "⚖️ All Candidate Thoughts" not in captured.out
+        assert "🚫 Heavily Dampened Thoughts:" not in captured.out
+
 
 class TestEdgeCases:
     """Test edge cases and error handling."""
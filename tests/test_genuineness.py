@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Tests for genuineness.py tracking storage (JSONL logs + compaction).
+"""
+
+import json
+import os
+import pytest
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+# Add project root to path so we can import genuineness module
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+import genuineness
+from genuineness import (
+    compact_genuineness_data,
+    load_genuineness_data,
+    track_entry,
+)
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    """Point genuineness' data and log files at a temporary directory."""
+    with patch.multiple(
+        genuineness,
+        GENUINENESS_DATA=tmp_path / "genuineness_data.json",
+        GENUINENESS_ENTRIES_LOG=tmp_path / "genuineness_entries.jsonl",
+        GENUINENESS_STYLE_LOG=tmp_path / "genuineness_style.jsonl",
+    ):
+        yield tmp_path
+
+
+def _track(n, output_text=""):
+    for i in range(n):
+        track_entry("Chaotic", "build-tool", f"summary {i}", "high", "positive", output_text)
+
+
+class TestTrackingLogs:
+    """track_entry appends; load_genuineness_data sees snapshot + logs."""
+
+    def test_track_appends_without_snapshot(self, data_dir):
+        _track(3, "Hello there! How are you?")
+        assert not (data_dir / "genuineness_data.json").exists()
+        data = load_genuineness_data()
+        assert len(data["entries"]) == 3
+        assert len(data["style_samples"]) == 3
+
+    def test_compaction_folds_logs_into_snapshot(self, data_dir):
+        _track(4, "Some output text.")
+        compact_genuineness_data()
+
+        snapshot = json.loads((data_dir / "genuineness_data.json").read_text())
+        assert len(snapshot["entries"]) == 4
+        assert len(snapshot["style_samples"]) == 4
+        assert sorted(os.listdir(data_dir)) == ["genuineness_data.json"]
+        assert len(load_genuineness_data()["entries"]) == 4
+
+    def test_repeated_compaction_does_not_duplicate(self, data_dir):
+        _track(2)
+        compact_genuineness_data()
+        _track(1)
+        compact_genuineness_data()
+        compact_genuineness_data()
+        assert len(load_genuineness_data()["entries"]) == 3
+
+    def test_append_during_compaction_is_kept(self, data_dir):
+        """A record appended after the log is moved aside survives the merge."""
+        _track(2)
+        real_save = genuineness.save_genuineness_data
+
+        def save_then_race(data):
+            _track(1)  # lands in a fresh log while the snapshot is written
+            real_save(data)
+
+        with patch.object(genuineness, "save_genuineness_data", save_then_race):
+            compact_genuineness_data()
+
+        assert len(load_genuineness_data()["entries"]) == 3
+        compact_genuineness_data()
+        snapshot = json.loads((data_dir / "genuineness_data.json").read_text())
+        assert len(snapshot["entries"]) == 3
+
+    def test_leftover_aside_file_is_merged(self, data_dir):
+        """An interrupted compaction's aside file is still read and merged."""
+        _track(2)
+        log = data_dir / "genuineness_entries.jsonl"
+        os.replace(log, data_dir / "genuineness_entries.jsonl.compacting")
+        _track(1)
+        assert len(load_genuineness_data()["entries"]) == 3
+
+        compact_genuineness_data()
+        assert len(load_genuineness_data()["entries"]) == 3
+        assert not (data_dir / "genuineness_entries.jsonl.compacting").exists()
+
+    def test_track_compacts_past_threshold(self, data_dir):
+        with patch.object(genuineness, "GENUINENESS_COMPACT_BYTES", 500):
+            _track(10)
+        assert (data_dir / "genuineness_data.json").exists()
+        log = data_dir / "genuineness_entries.jsonl"
+        assert not log.exists() or log.stat().st_size < 500
+        assert len(load_genuineness_data()["entries"]) == 10
@@ -274,6 +274,14 @@ class TestMoodNameChanges:
         assert result['drifted_to'] == 'social'
         assert 'chatty' in result['drift_note']
     
+    def test_threshold_boundaries(self):
+        """Overlapping thresholds should keep hyperfocus > cozy > restless > social precedence."""
+        assert get_mood_name_from_scores(2, -5, activity_count=3)['drifted_to'] == 'restless'
+        assert get_mood_name_from_scores(-2, 2, activity_count=3)['drifted_to'] == 'social'
+        assert get_mood_name_from_scores(5, 5, activity_count=3)['drifted_to'] == 'hyperfocus'
+        assert get_mood_name_from_scores(-2, -1, activity_count=3) is None
+        assert get_mood_name_from_scores(2, 0, activity_count=3) is None
+    
     def test_no_drift_threshold_not_met(self):
         """Scores below thresholds should not trigger mood change.""" 
         result = get_mood_name_from_scores(1, 1, activity_count=5)
@@ -306,6 +314,14 @@ class TestDriftMapIntegrity:
             assert len(entry['boost']) > 0, f"{key} has empty boost list"
             assert len(entry['dampen']) > 0, f"{key} has empty dampen list"
 
+    def test_drift_map_is_shared_and_read_only(self):
+        """Drift map should be built once and not be mutable by callers."""
+        drift_map = get_drift_map()
+
+        assert get_drift_map() is drift_map
+        with pytest.raises(TypeError):
+            drift_map['new_key'] = {'boost': [], 'dampen': []}
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
\ No newline at end of file